@@ -0,0 +1,1519 @@
+########################################################################################################
+# Sky Multiview by Mr.Servo @OpenATV (c) 2025 - skinned by stein17 @OpenATV                            #
+# Special thanks to stein17 @OpenA.TV for graphic design, skins, and icons                             #
+# Special thanks to jbleyel @OpenATV for his valuable support in E2-questions                          #
+# Special thanks to Anskar @OpenA.TV for consulting and testing                                        #
+# -----------------------------------------------------------------------------------------------------#
+# This plugin is licensed under the GNU version 3.0 <https://www.gnu.org/licenses/gpl-3.0.en.html>.    #
+# This plugin is NOT free software. It is open source, you are allowed to modify it (if you keep       #
+# the license), but it may not be commercially distributed. Advertise with this plugin is not allowed. #
+# For other uses, permission from the authors is necessary.                                            #
+########################################################################################################
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import wraps
+from json import dump, dumps, load, loads
+from operator import attrgetter, itemgetter
+from os import replace
+from os.path import dirname, join, exists, getmtime
+import re
+from statistics import median
+from threading import Lock
+from time import perf_counter, time
+from unicodedata import normalize
+from zlib import crc32
+from twisted.internet.reactor import callFromThread, callInThread
+
+from enigma import eTimer, eServiceReference, eEPGCache, iPlayableService, getDesktop
+from Components.ActionMap import ActionMap
+from Components.Pixmap import Pixmap
+from Components.Renderer import Picon as piconRenderer
+from Components.Renderer.Picon import getPiconName
+from Components.ServiceEventTracker import ServiceEventTracker
+from Components.Sources.List import List
+from Components.Sources.StaticText import StaticText
+from Screens.AudioSelection import AudioSelection
+from Screens.MessageBox import MessageBox
+from Screens.Screen import Screen
+from Screens.VirtualKeyBoard import VirtualKeyBoard
+from Tools.Directories import resolveFilename, SCOPE_PLUGINS
+from Tools.LoadPixmap import LoadPixmap
+
+from . import __version__
+
+
+class MVglobals:
+	RELEASE = f"v{__version__}"
+	MODULE_NAME = __name__.split(".")[-2]
+	PLUGINPATH = resolveFilename(SCOPE_PLUGINS, "Extensions/SkyMultiview/")  # e.g. /usr/lib/enigma2/python/Plugins/Extensions/SkyMultiview/
+	RESOLUTION = "FHD" if getDesktop(0).size().width() > 1300 else "HD"
+	BULKSEARCH = True  # True = one EPG query per multiview type for all overviews, False = one EPG query per overview
+	EPGPAGESIZE = 128  # MAX_RESULTS of the first EPG query, doubled and asked again as long as the result comes back full
+	EPGMAXRESULTS = 8192  # upper limit for the doubling above
+	EPGLOOKBACK = 1800  # single broadcasts that ended up to 30 minutes ago are still assigned, e.g. on extra time
+	EPGLOOKAHEAD = 604800  # ignore EPG events that start more than 7 days in the future
+	EPGWORKERS = 0  # >1 = run the searches for the single broadcasts concurrently on this many threads, 0 = one after another
+	EPGQUERYTIMEOUT = 10  # seconds to wait for each concurrent search from its start, a search that takes longer is treated as empty
+	MATCHWINDOW = 1800  # single broadcasts must start within this many seconds after their multiview overview
+	CACHEFILE = join(PLUGINPATH, "mvcache.json")  # last known multiviews for an instant start of the plugin
+	EPGRECORDFILE = join(PLUGINPATH, "epgrecord.jsonl")  # if this file exists, every EPG pass records its raw search results into it
+	EPGREPLAYFILE = join(PLUGINPATH, "epgreplay.jsonl")  # if this file exists, a recording (see above) is replayed instead of searching the EPG
+	ZAPDELAY = 400  # ms without further key presses before MVmain really retunes
+	AUDIODELAY = 500  # ms of quiet after the last 'evUpdatedInfo' before the audio track display is redrawn
+	PIXMAPCACHE = 32  # max. number of decoded picons and logos kept by MVpixmaps
+	EPGINTERVAL = 300  # re-read the EPG every 5 minutes, in between the menulist is refreshed at the next time boundary only
+	ROWWINDOW = 5  # only rows up to 5 above or below the selected one are built (the listbox shows 3), the others are placeholders until scrolled near
+	STREAMINTERVAL = 0.5  # s between two updates of the menulist while the EPG is still being searched, the first multiview is shown at once
+	WARMINTERVAL = 3600  # the background pass (see 'sessionstart()' in 'plugin.py') reads the EPG at least once an hour...
+	WARMAHEAD = 900  # ...and 15 minutes before each multiview starts
+	WARMIDLEINTERVAL = 21600  # without any multiview in the EPG only one search every 6 hours, nothing else is computed or kept
+	WARMRECORDS = 64  # max. number of multiviews kept warm, the soonest ones
+	STATSFILE = join(PLUGINPATH, "mvstats.json")  # if this file exists, the hot paths are timed and their rolling stats are written into it
+	STATSWINDOW = 100  # the rolling stats cover the last 100 calls of each hook
+	STATSINTERVAL = 60  # write the stats file at most once a minute
+
+
+mvglobals = MVglobals
+
+
+class MVstats:  # rolling timings of the hot paths, collected only if MVglobals.STATSFILE exists, therefore it may stay in production code
+	def __init__(self):
+		self.enabled = False
+		self.timings = {}  # {hook: deque of the last STATSWINDOW durations in ms}
+		self.counts = {}  # {hook: number of calls since the plugin was loaded}
+		self.epgStats = {}  # counters of the last EPG pass, see MVhelpers.epgStats
+		self.writeTs = 0
+		self.lock = Lock()  # hooks are timed in the reactor thread as well as in worker threads
+		self.writeLock = Lock()  # both threads may write the file, 'getSummary()' takes 'lock' itself
+
+	def setup(self):  # once per plugin start, so the stats can be switched on and off without restarting enigma2
+		self.enabled = exists(mvglobals.STATSFILE)
+
+	def timed(self, hook):  # decorator, while disabled a call costs one check only
+		def decorator(function):
+			@wraps(function)
+			def wrapper(*args, **kwargs):
+				if not self.enabled:
+					return function(*args, **kwargs)
+				startTs = perf_counter()
+				try:
+					return function(*args, **kwargs)
+				finally:
+					self.stop(hook, startTs)
+			return wrapper
+		return decorator
+
+	def start(self):  # for timings that span several calls, e.g. from the request of a refresh until it is shown
+		return perf_counter() if self.enabled else 0
+
+	def stop(self, hook, startTs):
+		if startTs:
+			self.add(hook, (perf_counter() - startTs) * 1000)
+
+	def add(self, hook, durationMs):
+		if self.enabled:
+			with self.lock:
+				if hook not in self.timings:
+					self.timings[hook] = deque(maxlen=mvglobals.STATSWINDOW)
+				self.timings[hook].append(durationMs)
+				self.counts[hook] = self.counts.get(hook, 0) + 1
+			if time() - self.writeTs > mvglobals.STATSINTERVAL:
+				self.write(mvglobals.STATSINTERVAL)
+
+	def getSummary(self):  # {hook: {'count': .., 'min': .., 'median': .., 'p95': .., 'max': ..}}, all durations in ms
+		summary = {}
+		with self.lock:
+			timings = {hook: sorted(durations) for hook, durations in self.timings.items()}
+			counts = dict(self.counts)
+		for hook, durations in sorted(timings.items()):
+			p95 = durations[max(0, -(-len(durations) * 95 // 100) - 1)]  # nearest rank
+			summary[hook] = {"count": counts[hook], "min": round(durations[0], 2), "median": round(median(durations), 2), "p95": round(p95, 2), "max": round(durations[-1], 2)}
+		return summary
+
+	def getText(self):  # for MVstatsOverlay
+		lines = [f"{hook}: {values['median']:.1f} / {values['p95']:.1f} / {values['max']:.1f} ms (min {values['min']:.1f}, {values['count']}x)" for hook, values in self.getSummary().items()]
+		if self.epgStats:
+			lines.append(f"letzter EPG-Lauf: {', '.join(f'{counter} {value}' for counter, value in self.epgStats.items())}")
+		matchCounts = MVhelpers.matchCounts
+		if matchCounts["hits"] or matchCounts["misses"]:
+			lines.append(f"EPG unverändert: {matchCounts['hits']} von {matchCounts['hits'] + matchCounts['misses']} Läufen")
+		return "\n".join(["Median / p95 / Max", *lines]) if lines else "noch keine Messwerte"
+
+	def write(self, minInterval=0):  # 'minInterval' > 0: skip if another thread has written the file within the last 'minInterval' seconds
+		with self.writeLock:
+			if minInterval and time() - self.writeTs <= minInterval:
+				return
+			self.writeTs = time()
+			try:
+				with open(f"{mvglobals.STATSFILE}.tmp", "w") as file:
+					dump({"timestamp": int(self.writeTs), "window": mvglobals.STATSWINDOW, "hooks": self.getSummary(), "epgStats": self.epgStats, "matchCache": MVhelpers.matchCounts}, file, indent=1)
+				replace(f"{mvglobals.STATSFILE}.tmp", mvglobals.STATSFILE)
+			except OSError as error:
+				print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'MVstats.write': {error}")
+
+
+mvstats = MVstats()
+
+
+class MVclassifier:  # classifies EPG titles and service names in one pass, every distinct text only once
+	sportRules = (("fussball", "liveBL.png", ("bl", "buli", "cl", "league", "fifa", "uefa")),  # (sport, logo, keywords)
+				("tennis", "liveTennis.png", ("tennis", "atp", "wta", "davis", "fed", "open", "wimbleton")),
+				("formel1", "liveF1.png", ("f1", "formel1", "formel-1")),
+				("golf", "liveGolf.png", ("golf", "pga", "ryder", "fedex", "wgc"))
+				)
+	channelKeys = ("bundesliga", "buli", "sport")  # a multiview channel has one of these and a number in its name, e.g. 'Sky Sport Bundesliga 3'
+	nameMap = {"FCBayernMünchen": "BayernMünchen", "FCBayern": "BayernMünchen", "BorussiaM'Gladbach": "BorussiaMönchengladbach",
+			"FCSchalke04": "Schalke04", "FCIngolstadt04": "FCIngolstadt", "SCPaderborn07": "FCPaderborn", "BVB": "BorussiaDortmund"
+			}
+	MVclass = namedtuple("MVclass", ("sport", "logo", "channelNo", "isSky", "isMVchannel"))
+
+	def __init__(self):
+		self.sportRegex = re.compile("|".join(f"(?P<{sport}>{'|'.join(re.escape(key) for key in keys)})" for sport, logo, keys in self.sportRules))
+		self.channelRegex = re.compile("|".join(re.escape(key) for key in self.channelKeys))
+		self.numberRegex = re.compile(r"\d+")
+		self.logos = {sport: logo for sport, logo, keys in self.sportRules}
+		self.teamNames = {normalize("NFC", name): normalize("NFC", teamName) for name, teamName in self.nameMap.items()}  # the EPG sends composed umlauts
+		self.aliases = {}  # {teamName: (name, ...)}, e.g. {'BorussiaDortmund': ('BVB',)}
+		for name, teamName in self.teamNames.items():
+			self.aliases[teamName] = self.aliases.get(teamName, ()) + (name,)
+		self.wordRegex = re.compile(r"[A-ZÄÖÜ][a-zäöüß]{2,}")  # e.g. 'BorussiaDortmund' -> 'Borussia', 'Dortmund'
+		self.classes = {}  # {text: MVclass}, service names and multiview types repeat in every EPG pass
+		self.teamKeys = {}  # {team: (key, ...)}, teams repeat in every EPG pass
+
+	def classify(self, text):
+		mvClass = self.classes.get(text)
+		if mvClass is None:
+			textLow = text.lower()
+			sportRes, numberRes = self.sportRegex.search(textLow), self.numberRegex.search(textLow)
+			sport = sportRes.lastgroup if sportRes else ""
+			channelNo = int(numberRes.group()) if numberRes else 0
+			mvClass = self.MVclass(sport, self.logos.get(sport, ""), channelNo, "sky" in textLow, bool(numberRes and self.channelRegex.search(textLow)))
+			self.classes[text] = mvClass
+		return mvClass
+
+	def getTeams(self, caption):  # e.g. 'FCBayernMünchen - BorussiaDortmund' -> ('BayernMünchen', 'BorussiaDortmund')
+		teams = [normalize("NFC", team.strip()) for team in caption.split(" - ")]
+		return tuple(self.teamNames.get(team, team) for team in teams) if len(teams) == 2 else ()
+
+	def getTeamKey(self, text):  # e.g. 'Bayern München' or 'BAYERNMÜNCHEN' -> 'bayernmünchen'
+		return "".join(char for char in normalize("NFC", text).casefold() if char.isalnum())
+
+	def getTeamKeys(self, team):  # full name first, then its words and aliases, e.g. 'BorussiaDortmund' -> ('borussiadortmund', 'borussia', 'dortmund', 'bvb')
+		teamKeys = self.teamKeys.get(team)
+		if teamKeys is None:
+			names = (team, *self.wordRegex.findall(team), *self.aliases.get(team, ()))
+			teamKeys = tuple(dict.fromkeys(self.getTeamKey(name) for name in names))
+			self.teamKeys[team] = teamKeys
+		return teamKeys
+
+
+mvclassifier = MVclassifier()
+
+
+class MVpixmaps:  # resolves picons and logos once, found and missing files are remembered until their directory changes, missing standard picons for one EPG pass
+	def __init__(self):
+		self.lock = Lock()  # used by the reactor thread (MVeventSelect.materializeRows) and the refresh worker at the same time
+		self.paths = {}  # {(service reference or logo, resolution): file path, "" if there is none}
+		self.pixmaps = OrderedDict()  # {file path: pixmap}, least recently used first
+		self.dirMtimes = {}  # {directory: mtime} of all directories that have been searched
+		self.piconPaths = None  # search paths of the Picon renderer when a standard picon was missing, e.g. ('/media/hdd/picon/', '/usr/share/enigma2/picon/')
+		self.piconMisses = set()  # service references without a standard picon, looked up again on every EPG pass
+
+	def getLogo(self, iconFile):
+		pathKey = (iconFile, mvglobals.RESOLUTION)
+		with self.lock:
+			path = self.paths.get(pathKey)
+			if path is None:
+				path = self.checkFile(join(mvglobals.PLUGINPATH, f"pics/{mvglobals.RESOLUTION}/{iconFile}") if iconFile else "")
+				self.paths[pathKey] = path
+			return self.getPixmap(path)
+
+	def getPicon(self, mvSref, channelNo):
+		pathKey = ((mvSref, channelNo), mvglobals.RESOLUTION)
+		with self.lock:
+			path = self.paths.get(pathKey)
+			if path is None:
+				piconFile = self.checkFile(join(mvglobals.PLUGINPATH, f"pics/{mvglobals.RESOLUTION}/buli{channelNo}.png"))
+				path = piconFile or self.checkFile(getPiconName(mvSref))  # fallback to standard picon
+				self.paths[pathKey] = path
+				if not path:  # getPiconName() returns no path on a miss: watch all of its search paths instead
+					self.piconMisses.add(mvSref)
+					self.watchPiconPaths()
+			return self.getPixmap(path)
+
+	def checkFile(self, path):
+		if not path:
+			return ""
+		self.watchDirectory(dirname(path))
+		return path if exists(path) else ""
+
+	def watchDirectory(self, directory):
+		if directory not in self.dirMtimes and exists(directory):
+			self.dirMtimes[directory] = getmtime(directory)
+
+	def watchPiconPaths(self):  # a picon installed later into any search path, or a newly mounted one, must end the miss
+		if self.piconPaths is None and not hasattr(piconRenderer, "searchPaths"):  # e.g. the paths are kept elsewhere by this image, only the retry of 'piconMisses' remains
+			print(f"[{mvglobals.MODULE_NAME}] WARNING in module 'watchPiconPaths': Picon renderer has no 'searchPaths', missing picons are looked up again on every EPG pass")
+		self.piconPaths = tuple(getattr(piconRenderer, "searchPaths", ()))  # the list is rebuilt by the renderer on (un)mounts, so read it each time
+		for directory in self.piconPaths:
+			self.watchDirectory(directory)
+
+	def getPixmap(self, path):
+		if not path:
+			return None
+		pixmap = self.pixmaps.pop(path, None) or LoadPixmap(cached=True, path=path)
+		self.pixmaps[path] = pixmap  # (re-)insert as most recently used
+		while len(self.pixmaps) > mvglobals.PIXMAPCACHE:
+			self.pixmaps.popitem(last=False)
+		return pixmap
+
+	def checkDirectories(self):  # once per EPG pass: forget everything if a picon or logo directory has been modified
+		with self.lock:
+			try:
+				modified = any(getmtime(directory) != mtime for directory, mtime in self.dirMtimes.items())
+			except OSError:  # directory has been removed
+				modified = True
+			if self.piconPaths is not None and tuple(getattr(piconRenderer, "searchPaths", ())) != self.piconPaths:
+				modified = True
+			if not modified and self.piconMisses:  # in case the search paths cannot be watched, e.g. picons on a network share
+				modified = any(getPiconName(mvSref) for mvSref in self.piconMisses)
+			if modified:
+				self.paths, self.pixmaps, self.dirMtimes, self.piconPaths, self.piconMisses = {}, OrderedDict(), {}, None, set()
+			return modified
+
+
+mvpixmaps = MVpixmaps()
+
+
+class MVbroadcast(namedtuple("MVbroadcast", ("epgSname", "epgSref", "epgTitle", "epgEvent", "epgStart", "epgDurance", "epgCaption", "epgTeams"))):  # a single broadcast or a conference, immutable
+	__slots__ = ()
+
+	@classmethod
+	def fromEPG(cls, sResult):
+		title = sResult[3]  # e.g. 'LiveBL:1.FSVMainz05-WerderBremen,9.Spieltag'
+		caption = title.split(":")[1].split(",")[0].replace("-", " - ") if ":" in title else ""  # e.g. '1.FSVMainz05 - WerderBremen'
+		return cls(sResult[6], sResult[7], title, sResult[4], sResult[1], sResult[2], caption, mvclassifier.getTeams(caption))
+
+
+class MVoverview(namedtuple("MVoverview", ("mvStart", "mvId", "mvSname", "mvSref", "mvTitle", "mvEvent", "mvDurance", "channels", "conferences", "mvEnd", "mvEventText", "channelNo"))):  # a multiview overview, immutable
+	__slots__ = ()
+
+	@classmethod
+	def fromEPG(cls, mvId, sResult):  # e.g. mvId = 'LiveBL' or 'Live2.BL'
+		mvStart, mvSname, mvEvent, mvDurance = sResult[1], sResult[6], sResult[4], sResult[2]
+		mvEventText = mvEvent.replace(":", ": ").replace(",", ", ").replace(".", ". ").replace("Multiview", "")  # e.g. 'Fußball: 2. BundesligaSonntags-Konferenz, 11. Spieltag'
+		return cls(mvStart, mvId, mvSname, sResult[7], sResult[3].strip("'"), mvEvent, mvDurance, (), (),
+					mvStart + mvDurance, ",".join(mvEventText.split(",")[:2]), mvclassifier.classify(mvSname).channelNo)  # e.g. 'Sky Sport Bundesliga 1' -> 1
+
+	@classmethod
+	def fromJSON(cls, fields):  # inverse of 'dumps()', which stores the records as plain lists
+		mvRecord = cls._make(fields)
+		return mvRecord._replace(channels=tuple(MVbroadcast._make(channel)._replace(epgTeams=tuple(channel[-1])) for channel in mvRecord.channels),
+								conferences=tuple(MVbroadcast._make(conference)._replace(epgTeams=tuple(conference[-1])) for conference in mvRecord.conferences))
+
+	@property
+	def mvTupleId(self):
+		return (self.mvId, self.mvSref, self.mvStart)
+
+
+class MVteamIndex:  # finds the channel of a team or a fixture without parsing any EPG title again, see MVbroadcast.epgTeams
+	def __init__(self, mvRecords):
+		self.teams = {}  # {team key: [(mvTupleId, channel index), ...]}, the soonest multiview first
+		self.fixtures = {}  # {(team key, team key): [(mvTupleId, channel index), ...]}, keys of the full names in alphabetical order
+		for mvRecord in mvRecords:  # sorted by start time
+			for channelIndex, channel in enumerate(mvRecord.channels):  # the cursor index in MVmain
+				hit = (mvRecord.mvTupleId, channelIndex)
+				teamKeys = [mvclassifier.getTeamKeys(team) for team in channel.epgTeams]
+				for keys in teamKeys:
+					for key in keys:
+						hits = self.teams.setdefault(key, [])
+						if hit not in hits:  # e.g. 'borussia' in 'Borussia Dortmund - Borussia Mönchengladbach'
+							hits.append(hit)
+				if len(teamKeys) == 2:
+					self.fixtures.setdefault(tuple(sorted((teamKeys[0][0], teamKeys[1][0]))), []).append(hit)
+
+	def find(self, query):  # e.g. 'Bayern', 'BVB' or 'Bayern München - Borussia Dortmund'
+		queryParts = query.split("-")
+		if len(queryParts) == 2:
+			hits = self.fixtures.get(tuple(sorted(mvclassifier.getTeamKey(part) for part in queryParts)))
+			if hits:
+				return hits
+			otherHits = self.findTeam(queryParts[1])  # e.g. 'Bayern - Dortmund': games in which both teams occur
+			return [hit for hit in self.findTeam(queryParts[0]) if hit in otherHits]
+		return self.findTeam(queryParts[0]) if len(queryParts) == 1 else []
+
+	def findTeam(self, queryPart):  # the full name first, else the games in which all of its words occur, e.g. 'SV Werder Bremen' -> 'werder' and 'bremen'
+		hits = self.teams.get(mvclassifier.getTeamKey(queryPart))
+		if hits is None:
+			wordKeys = [key for key in map(mvclassifier.getTeamKey, queryPart.split()) if len(key) > 3 or key in self.teams]  # club prefixes like 'SV', 'SC' or '1.' are not indexed as words
+			hits = [hit for hit in self.teams.get(wordKeys[0], ()) if all(hit in self.teams.get(key, ()) for key in wordKeys[1:])] if wordKeys else []
+		return hits
+
+
+class MVepgRecorder:  # wraps eEPGCache and streams every search and its raw results into a file, one JSON line each
+	def __init__(self, instance, recordFile):
+		self.instance = instance
+		self.recordFile = recordFile
+		self.file = None
+		self.lock = Lock()  # searches may run concurrently, see MVglobals.EPGWORKERS
+
+	def begin(self):
+		try:
+			self.file = open(f"{self.recordFile}.tmp", "w")
+			self.file.write(f"{dumps({'version': 1, 'recorded': int(time())})}\n")
+		except OSError as error:
+			print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'MVepgRecorder.begin': {error}")
+			self.file = None
+
+	def search(self, criteria):
+		results = self.instance.search(criteria) or []
+		with self.lock:
+			if self.file:  # [SEARCH_FIELDS, MAX_RESULTS, QUERY_TYPE, QUERY, CASE_INSENSITIVE_QUERY, [results...]]
+				self.file.write(f"{dumps([*criteria, results], ensure_ascii=False, separators=(',', ':'))}\n")
+		return results
+
+	def end(self):
+		with self.lock:
+			if self.file:
+				self.file.close()
+				self.file = None
+				replace(f"{self.recordFile}.tmp", self.recordFile)  # the last complete EPG pass wins
+
+
+class MVepgReplay:  # stands in for eEPGCache and answers searches from a recording of MVepgRecorder
+	def __init__(self, replayFile):
+		self.queries = {}
+		with open(replayFile) as file:
+			self.recorded = loads(file.readline()).get("recorded", 0)  # the recording is replayed as if it were this time
+			for line in file:
+				record = loads(line)
+				self.queries[(record[2], record[3], record[4])] = [tuple(result) for result in record[5]]  # (QUERY_TYPE, QUERY, CASE_INSENSITIVE_QUERY)
+
+	def search(self, criteria):
+		return self.queries.get((criteria[2], criteria[3], criteria[4]), [])[:criteria[1]]
+
+
+class MVhelpers:
+	resultSizes = {}  # {queryStr: number of results of the last query}, the next query starts big enough
+	epgStats = None  # {counter: value} of the running EPG pass, e.g. {'queries': 5, 'scanned': 812, 'matched': 33, 'deduped': 2}
+	matchCache = None  # (fingerprint of the overviews, fingerprints of the broadcast searches, mvRecords, maxRecords) of the last EPG pass, shared by MVeventSelect and MVwarmer
+	matchCounts = {"hits": 0, "misses": 0}  # EPG passes answered from 'matchCache' and passes that had to match, since the plugin was loaded
+
+	def getEPGinstance(self):
+		instance = eEPGCache.getInstance()
+		if exists(mvglobals.EPGREPLAYFILE):  # in order to get EPG-infos during commercial breaks, for testing purposes only
+			return MVepgReplay(mvglobals.EPGREPLAYFILE)
+		if exists(mvglobals.EPGRECORDFILE):
+			return MVepgRecorder(instance, mvglobals.EPGRECORDFILE)
+		return instance
+
+	@mvstats.timed("getEPGmvRecords")
+	def getEPGmvRecords(self, streamFunc=None, maxRecords=None):  # 'streamFunc' gets every multiview as soon as its channels are matched, still in EPG order, 'maxRecords' keeps the soonest ones only
+		recorder = self._instance if isinstance(self._instance, MVepgRecorder) else None
+		nowTs = self._instance.recorded if isinstance(self._instance, MVepgReplay) else time()
+		self.epgStats = {}
+		if recorder:
+			recorder.begin()
+		try:
+			overviews, fingerprints, matchCache = self.findMultiviews(nowTs), [], self.matchCache
+			overviewsHash = hash(tuple(overviews))
+			queries = self.iterQueries(self.getQueryIds(overviews), nowTs)
+			if matchCache and matchCache[0] == overviewsHash and (matchCache[3] is None or (maxRecords or len(overviews)) <= matchCache[3]):  # discovery unchanged: the broadcasts probably too, search them all before matching anything
+				allResults = list(queries)
+				fingerprints = [hash(tuple(results)) for results in allResults]
+				if fingerprints == matchCache[1]:  # the common case: nothing to match, nothing to sort, nothing to stream
+					self.matchCounts["hits"] += 1
+					self.countStats(cached=1)
+					return matchCache[2][:maxRecords] if maxRecords else matchCache[2]
+				queries = iter(allResults)
+			else:
+				queries = self.fingerprintQueries(queries, fingerprints)  # searched lazily as before, so the matched multiviews can be streamed
+			self.matchCounts["misses"] += 1
+			mvRecords = []
+			for mvRecord in self.iterMatches(overviews, nowTs, queries):
+				mvRecords.append(mvRecord)
+				if streamFunc:
+					streamFunc(mvRecord)
+			mvRecords.sort(key=itemgetter(0))  # sort overviews relating start time (field 0 = 'mvStart')
+			if maxRecords and len(mvRecords) > maxRecords:
+				mvRecords = mvRecords[:maxRecords]
+			MVhelpers.matchCache = (overviewsHash, fingerprints, mvRecords, maxRecords if len(overviews) > len(mvRecords) else None)  # the records are immutable, so the list is handed out as it is
+			return mvRecords
+		finally:
+			if recorder:
+				recorder.end()
+			mvstats.epgStats = self.epgStats
+
+	def createMVindex(self, mvRecords):  # {mvTupleId: mvEntry} with all service references resolved in advance
+		mvIndex = {}
+		for mvRecord in mvRecords:
+			channels, conferences = mvRecord.channels, mvRecord.conferences
+			mvEntry = {"mvSname": mvRecord.mvSname, "mvRef": eServiceReference(mvRecord.mvSref) if mvRecord.mvSref else None,
+					"channels": channels, "channelRefs": tuple(eServiceReference(channel.epgSref) for channel in channels),
+					"conferences": conferences, "conferenceRefs": tuple(eServiceReference(conference.epgSref) for conference in conferences)}
+			mvIndex[mvRecord.mvTupleId] = mvEntry
+		return mvIndex
+
+	@mvstats.timed("epgSearch")
+	def epgSearch(self, queryStr, maxResults=128, epgStats=None):
+		criteria = ("IBDTSENRW", maxResults, eEPGCache.PARTIAL_TITLE_SEARCH, queryStr, 1)  # SEARCH_FIELDS, MAX_RESULTS, ..., CASE_INSENSITIVE_QUERY
+		results = self._instance.search(criteria) or []
+		self.countStats(epgStats, queries=1, scanned=len(results))
+		return results
+
+	def countStats(self, epgStats=None, **counts):  # 'epgStats' binds a search to its own pass, a timed out one may finish during the next
+		epgStats = self.epgStats if epgStats is None else epgStats
+		if epgStats is not None:  # nobody is interested outside of an EPG pass
+			for counter, count in counts.items():
+				epgStats[counter] = epgStats.get(counter, 0) + count
+
+	def epgQuery(self, queryStr, startTs, endTs, epgStats=None):  # all results of a search, limited to the events that overlap [startTs, endTs]
+		maxResults = max(mvglobals.EPGPAGESIZE, self.resultSizes.get(queryStr, 0) * 2)
+		results = self.epgSearch(queryStr, maxResults, epgStats)
+		while len(results) >= maxResults and maxResults < mvglobals.EPGMAXRESULTS:  # truncated: ask again for more instead of missing events
+			maxResults = min(maxResults * 2, mvglobals.EPGMAXRESULTS)
+			results = self.epgSearch(queryStr, maxResults, epgStats)
+		if len(results) >= mvglobals.EPGMAXRESULTS:
+			print(f"[{mvglobals.MODULE_NAME}] WARNING in module 'epgQuery': search for '{queryStr}' truncated to {len(results)} results")
+		self.resultSizes[queryStr] = len(results)
+		return [sResult for sResult in results if sResult[1] < endTs and sResult[1] + sResult[2] > startTs]
+
+	def isMVchannel(self, sName):
+		return mvclassifier.classify(sName).isMVchannel
+
+	def findMultiviews(self, nowTs):
+		def getMvType(searchTitle):
+			elements = searchTitle.split(",")
+			dataStr = elements[0].split(":") if len(elements) > 0 else ""
+			return dataStr[0].strip("'") if len(dataStr) > 0 else ""  # e.g. 'Live2.BL' or 'Live2.BLAlleSpiele,alleTore'
+
+		mvRecords = []
+		for sResult in self.epgQuery("multiview", nowTs, nowTs + mvglobals.EPGLOOKAHEAD):  # OUTER LOOP: find all valid multiview overviews that are not over yet
+			mvId, mvClass = getMvType(sResult[3]), mvclassifier.classify(sResult[6])
+			if not mvId or not mvClass.isSky or not mvClass.isMVchannel:  # skip on non-multiview overwies or non-sky-sport channels
+				continue  # valid overviews may still follow
+			mvRecords.append(MVoverview.fromEPG(mvId, sResult))
+		return mvRecords
+
+	def matchChannels(self, mvRecords, nowTs):
+		return sorted(self.iterMatches(mvRecords, nowTs), key=itemgetter(0))  # sort overviews relating start time (field 0 = 'mvStart')
+
+	def getQueryIds(self, mvRecords):  # the searches for the single broadcasts, in the order in which 'iterMatches()' needs their results
+		if mvglobals.BULKSEARCH:  # in order of first appearance, so the search for a type is done right before its first overview is matched
+			return list(dict.fromkeys(mvRecord.mvId for mvRecord in mvRecords))
+		return [mvRecord.mvId for mvRecord in mvRecords]  # one query per overview
+
+	def iterQueries(self, mvIds, nowTs):  # yields the results in the order of 'mvIds', no matter in which order the searches finish
+		def queryBroadcasts(queryIndex, mvId):  # single broadcasts may start up to MATCHWINDOW after the last overview within the look-ahead
+			startTimes[queryIndex] = perf_counter()
+			return self.epgQuery(mvId, nowTs - mvglobals.EPGLOOKBACK, nowTs + mvglobals.EPGLOOKAHEAD + mvglobals.MATCHWINDOW, epgStats)
+
+		epgStats, startTimes = self.epgStats, {}  # {query index: perf_counter() at the start of the search}
+		if mvglobals.EPGWORKERS < 2 or len(mvIds) < 2:
+			for queryIndex, mvId in enumerate(mvIds):  # a search is only started when its results are needed
+				yield queryBroadcasts(queryIndex, mvId)
+			return
+		pool = ThreadPoolExecutor(max_workers=min(mvglobals.EPGWORKERS, len(mvIds)))
+		try:
+			futures = [pool.submit(queryBroadcasts, queryIndex, mvId) for queryIndex, mvId in enumerate(mvIds)]
+			for queryIndex, (mvId, future) in enumerate(zip(mvIds, futures)):
+				waitTs = perf_counter()
+				while True:
+					startTs = startTimes.get(queryIndex, waitTs)  # not started yet: every worker is busy with an earlier search
+					try:
+						results = future.result(timeout=max(0, startTs + mvglobals.EPGQUERYTIMEOUT - perf_counter()))
+						break
+					except TimeoutError:  # the builtin since Python 3.11
+						if startTimes.get(queryIndex, startTs) > startTs:  # started while waiting: it gets its own EPGQUERYTIMEOUT
+							continue
+						future.cancel()
+						print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'iterQueries': search for '{mvId}' timed out after {mvglobals.EPGQUERYTIMEOUT}s")
+						results = []
+						break
+				yield results
+		finally:
+			pool.shutdown(wait=False, cancel_futures=True)  # a timed out search must not block the refresh, searches not yet started must not count into the next pass
+
+	def fingerprintQueries(self, queries, fingerprints):  # passes the results through and appends a fingerprint of each search to 'fingerprints'
+		for results in queries:
+			fingerprints.append(hash(tuple(results)))  # event ids, start times, titles, services: every field the matching looks at
+			yield results
+
+	def iterMatches(self, mvRecords, nowTs, queries=None):  # yields the overviews with their channels in EPG order, each one as soon as it is matched
+		def addCandidates(candidateIndex, foundIds, results):  # BULK LOOP: one query per multiview type covers all of its overviews
+			deduped = 0
+			for channelFound in results:
+				titleParts = channelFound[3].split(":")
+				if len(titleParts) != 2 or not mvclassifier.classify(channelFound[6]).isSky:
+					continue  # skip non-sky channels and titles without exactly one 'mvId:' prefix
+				eventId = (channelFound[7], channelFound[0])  # (service reference, event id)
+				if eventId not in foundIds:
+					foundIds.add(eventId)
+					candidateIndex.setdefault(titleParts[0], []).append(channelFound)  # e.g. {'LiveBL': [...], 'Live2.BL': [...]}
+				else:
+					deduped += 1
+			self.countStats(deduped=deduped)
+
+		def getCandidates(candidateIndex, mvId):
+			return [channelFound for prefix, candidates in candidateIndex.items() if prefix.endswith(mvId) for channelFound in candidates]
+
+		def createWindowIndex(candidates):
+			entries = sorted((channelFound[1], seq, channelFound) for seq, channelFound in enumerate(candidates))  # (start, EPG order, result)
+			return [entry[0] for entry in entries], entries
+
+		def findInWindow(windowIndex, mvStart):
+			starts, entries = windowIndex
+			hits = entries[bisect_left(starts, mvStart):bisect_right(starts, mvStart + mvglobals.MATCHWINDOW)]
+			return [entry[2] for entry in sorted(hits, key=itemgetter(1))]  # back to EPG order, it decides which conference is 'Konferenz 1'
+
+		foundEvents, windowIndexes, candidateIndex, foundIds = set(), {}, {}, set()
+		if queries is None:
+			queries = self.iterQueries(self.getQueryIds(mvRecords), nowTs)
+		for mvRecord in mvRecords:
+			mvId, mvStart = mvRecord.mvId, mvRecord.mvStart
+			channels, conferences, deduped = [], [], 0
+			if mvglobals.BULKSEARCH:
+				if mvId not in windowIndexes:  # overviews of the same type share one sorted index
+					addCandidates(candidateIndex, foundIds, next(queries))  # a type's own search finds all of its candidates, later searches add none
+					windowIndexes[mvId] = createWindowIndex(getCandidates(candidateIndex, mvId))
+				windowIndex = windowIndexes[mvId]
+			else:
+				windowIndex = createWindowIndex([channelFound for channelFound in next(queries) if mvclassifier.classify(channelFound[6]).isSky])  # skip non-sky channels
+			for channelFound in findInWindow(windowIndex, mvStart):  # INNER LOOP: find the individual broadcasts associated with the 'mvId'
+				start, title, sName = channelFound[1], channelFound[3], channelFound[6]
+				if len(title.split(":")) < 3 and f"{mvId}:" in title and "multiview" not in title.lower():
+					if (title, start) in foundEvents:
+						deduped += 1
+						continue
+					foundEvents.add((title, start))
+					if "konferenz" in title.lower():
+						conferences.append(MVbroadcast.fromEPG(channelFound))
+					elif self.isMVchannel(sName):
+						channels.append(MVbroadcast.fromEPG(channelFound))
+			channels.sort(key=attrgetter("epgSname"))  # sort single broadcasts relating service name
+			self.countStats(matched=len(channels) + len(conferences), deduped=deduped)
+			yield mvRecord._replace(channels=tuple(channels), conferences=tuple(conferences))
+
+
+class MVwarmer(MVhelpers):  # keeps the multiviews and their indexes warm between two starts of the plugin, shared by MVeventSelect and MVmain
+	def __init__(self):
+		self._instance = None
+		self.mvRecords, self.teamIndex, self.mvIndex = [], MVteamIndex([]), None
+		self.warmTs = 0  # time of the last publish, 0 = nothing warm yet
+		self.warmTimer = None
+		self.busy = False
+
+	def start(self):
+		if self.warmTimer is None:
+			self.warmTimer = eTimer()
+			self.warmTimer.callback.append(self.warmUp)
+		self.warmUp()
+
+	def stop(self):
+		if self.warmTimer:
+			self.warmTimer.stop()
+
+	def warmUp(self):
+		if not self.busy and time() - self.warmTs > mvglobals.EPGINTERVAL:  # skip if e.g. MVeventSelect is open and has just published its refresh
+			self.busy = True
+			callInThread(self.warmWorker)
+		else:
+			self.schedule()
+
+	def warmWorker(self):  # runs in a reactor worker thread
+		mvRecords, teamIndex = None, None
+		try:
+			instance = self.getEPGinstance()
+			self._instance = instance.instance if isinstance(instance, MVepgRecorder) else instance  # only the passes of MVeventSelect are recorded
+			mvRecords = self.getEPGmvRecords(maxRecords=mvglobals.WARMRECORDS)
+			teamIndex = MVteamIndex(mvRecords)
+		except Exception as error:  # e.g. an EPG error, the warm index stays as it is and the next pass tries again
+			print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'warmWorker': {error}")
+			mvRecords = None
+		finally:
+			callFromThread(self.warmFinished, mvRecords, teamIndex)  # always, or 'busy' would stop the warmer for the rest of the session
+
+	def warmFinished(self, mvRecords, teamIndex):  # back in the reactor thread, mvRecords=None after a failed pass
+		self.busy = False
+		if mvRecords is not None:
+			self.publish(mvRecords, teamIndex)
+			self.schedule()
+		elif self.warmTimer:
+			self.warmTimer.startLongTimer(mvglobals.WARMINTERVAL)  # not as late as WARMIDLEINTERVAL, the EPG may have multiviews after all
+
+	def publish(self, mvRecords, teamIndex):  # also called by MVeventSelect after each refresh
+		if len(mvRecords) > mvglobals.WARMRECORDS:
+			matchCache = MVhelpers.matchCache
+			mvRecords = mvRecords[:mvglobals.WARMRECORDS]
+			teamIndex = MVteamIndex(mvRecords)
+			if matchCache and len(matchCache[2]) > mvglobals.WARMRECORDS:  # 'matchCache' outlives MVeventSelect, it must not keep more than the warmer does
+				MVhelpers.matchCache = (*matchCache[:2], matchCache[2][:mvglobals.WARMRECORDS], mvglobals.WARMRECORDS)
+		self.mvRecords, self.teamIndex, self.mvIndex, self.warmTs = mvRecords, teamIndex, None, time()
+
+	def getMVindex(self):  # service references are resolved once per publish, not on every start of MVmain
+		if self.mvIndex is None:
+			self.mvIndex = self.createMVindex(self.mvRecords)
+		return self.mvIndex
+
+	def schedule(self):
+		if self.warmTimer:
+			nowTs = time()
+			if self.mvRecords:
+				nextTs = min([mvRecord.mvStart - mvglobals.WARMAHEAD for mvRecord in self.mvRecords if mvRecord.mvStart - mvglobals.WARMAHEAD > nowTs] + [nowTs + mvglobals.WARMINTERVAL])
+			else:
+				nextTs = nowTs + mvglobals.WARMIDLEINTERVAL
+			self.warmTimer.startLongTimer(max(60, int(nextTs - nowTs)))
+
+
+mvwarmer = MVwarmer()
+
+
+class MVmain(Screen, MVhelpers):
+	skin = """
+	<screen name="MVmain" position="0,0" size="1280,720" resolution="1280,720" title="Sky Multiview" backgroundColor="#FF000000">
+		<widget source="audiotext" render="Label" position="0,0" size="600,30" valign="top" halign="center" font="Regular;24" textBorderColor="#00505050" textBorderWidth="1" foregroundColor="#00ffff00" backgroundColor="#16000000" transparent="1">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget name="mvcursor" position="0,0" size="934,628" />
+		<widget source="mvtext" render="Label" position="40,690" size="150,30" font="Regular;20" valign="center" backgroundColor="#FF000000" />
+		<widget source="mvtext" render="Pixmap" pixmap="~button.png" position="10,692" size="24,24" scale="1" alphatest="blend" conditional="mvtext">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget source="key_red" render="Pixmap" pixmap="~key_red.png" alphatest="blend" position="220,692" size="24,24" backgroundColor="#007a6213" objectTypes="key_red,StaticText" transparent="1">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget source="key_red" render="Label" position="250,690" size="180,30" noWrap="1" zPosition="+1" valign="center" font="Regular;20" halign="left" foregroundColor="grey" backgroundColor="#16000000" objectTypes="key_red,StaticText" transparent="1" />
+		<widget source="key_green" render="Pixmap" pixmap="~key_green.png" alphatest="blend" position="470,692" size="24,24" backgroundColor="#00006600,#0024a424,vertical" cornerRadius="12" objectTypes="key_green,StaticText" transparent="1">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget source="key_green" render="Label" position="500,690" size="180,30" noWrap="1" zPosition="+1" valign="center" font="Regular;20" halign="left" foregroundColor="grey" backgroundColor="#16000000" objectTypes="key_green,StaticText" transparent="1" />
+		<widget source="key_yellow" render="Pixmap" pixmap="~key_yellow.png" alphatest="blend" position="720,692" size="24,24" backgroundColor="#007a6213,#00e6c619,vertical" cornerRadius="12" objectTypes="key_yellow,StaticText" transparent="1">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget source="key_yellow" render="Label" position="750,690" size="180,30" noWrap="1" zPosition="+1" valign="center" font="Regular;20" halign="left" foregroundColor="grey" backgroundColor="#16000000" objectTypes="key_yellow,StaticText" transparent="1" />
+		<widget source="exittext" render="Label" position="center,center" size="1280,30" valign="center" halign="center" zPosition="1" font="Regular;20" transparent="1" foregroundColor="#00FFFFFF" />
+	</screen>
+	"""
+
+	positionsCache = {}  # {resolution: (mtime of 'mvcursorpos.cfg', [(cursor positions for 1 channel), (... for 2 channels), ...])}
+	cursorPixmaps = {}  # {(resolution, filename): decoded cursor pixmap}, shared by all MVmain instances
+
+	def __init__(self, session, mvTupleId, mvIndex, mvinfobox, cursorIndex=0):
+		self.mvTupleId = mvTupleId  # =(mvId, mvSref, mvStart)
+		self.mvEntry = mvIndex.get(mvTupleId, {}) if mvTupleId else {}
+		self.mvInfobox = mvinfobox
+		self._instance = eEPGCache.getInstance()
+		self.skin = self.skin.replace("~", f"{mvglobals.PLUGINPATH}/pics/{mvglobals.RESOLUTION}/")
+		Screen.__init__(self, session)
+		ServiceEventTracker(screen=self, eventmap={iPlayableService.evStart: self.serviceStarted, iPlayableService.evUpdatedInfo: self.serviceInfoUpdated})
+		self.multiviewActive = False
+		self.currCursorIndex, self.currAudioTrack = cursorIndex, 0  # cursorIndex > 0: jump to a game found by MVteamIndex
+		self.channels, self.conferences, self.positions = [], [], []
+		self.cursorFile = ""  # cursor pixmap currently shown, only a change of side needs a new pixmap
+		self.mvRef, self.channelRefs, self.conferenceRefs = None, [], []
+		self["audiotext"] = StaticText()
+		self["mvcursor"] = Pixmap()
+		self.hideCursor()
+		self["mvtext"] = StaticText()
+		self.hideMVactive()
+		self["key_red"] = StaticText()
+		self["key_green"] = StaticText()
+		self["key_yellow"] = StaticText()
+		self["key_blue"] = StaticText()
+		self["exittext"] = StaticText()
+		self.startChannel = self.session.nav.getCurrentlyPlayingServiceReference()
+		self["actions"] = ActionMap(["WizardActions", "ColorActions", "MenuActions", "NumberActions"], {
+			"ok": self.keyOk,
+			"1": self.key1,
+			"2": self.key2,
+			"3": self.key3,
+			"4": self.key4,
+			"5": self.key5,
+			"6": self.key6,
+			"7": self.key7,
+			"8": self.key8,
+			"9": self.key9,
+			"back": self.keyExit,
+			"left": self.keyLeft,
+			"right": self.keyRight,
+			"up": self.keyUp,
+			"down": self.keyDown,
+			"red": self.keyRed,
+			"green": self.keyGreen,
+			"yellow": self.keyYellowShort,
+			"yellowlong": self.keyYellowLong,
+			"menu": self.keyMenu,
+			"info": self.keyMenu
+		}, -1)
+		self.audioTimer = eTimer()
+		self.audioTimer.callback.append(self.hideAudioText)
+		self.exitTimer = eTimer()
+		self.exitTimer.callback.append(self.hideExitText)
+		self.zapTimer = eTimer()
+		self.zapTimer.callback.append(self.zapNow)
+		self.zapTarget, self.zapMeasure = None, None
+		self.audioInfoTimer = eTimer()
+		self.audioInfoTimer.callback.append(self.serviceUpdated)
+		self.audioCache = {}  # {serviceRef string: (audio PIDs, track names)}
+		self.positions = self.readPositionsFile()
+		self.onLayoutFinish.append(self.startMain)
+
+	@mvstats.timed("startMain")
+	def startMain(self):
+		abort = True
+		if self.mvEntry:
+			self.mvRef = self.mvEntry["mvRef"]
+			if self.mvRef:
+				self.multiviewActive = True
+				self.hideAudioText()
+				self.hideColorKeys()
+				self.hideExitText()
+				self.mvInfobox.showDialog(f"Schalte zur Multiview-Übersicht:\n{self.mvEntry['mvSname']}")
+				self.channels, self.conferences = self.mvEntry["channels"], self.mvEntry["conferences"]
+				self.channelRefs, self.conferenceRefs = self.mvEntry["channelRefs"], self.mvEntry["conferenceRefs"]
+				if self.channels:
+					abort = False
+					self.zapTo(self.mvRef, self.mvEntry["mvSname"], debounce=False)
+					self.show()
+					self.showMVactive()
+					self.showColorKeys()
+					self.showCursor(self.currCursorIndex)
+		if abort:
+			self.session.open(MessageBox, "ABBRUCH: Es konnten keine Einzelsendungen zugeordnet werden. Bitte EPG-Daten löschen und frisch auffüllen.", type=MessageBox.TYPE_ERROR, timeout=10, close_on_any_key=True)
+			self.escape()
+
+	def readPositionsFile(self):  # the compiled table is reused until 'mvcursorpos.cfg' gets modified
+		posFile = join(mvglobals.PLUGINPATH, "mvcursorpos.cfg")
+		if not exists(posFile):
+			self.session.open(MessageBox, f"ABBRUCH: Die Datei\n'{posFile}'\nkonnte nicht gefunden werden", type=MessageBox.TYPE_ERROR, timeout=10, close_on_any_key=True)
+			return []
+		mtime = getmtime(posFile)
+		cachedMtime, posList = self.positionsCache.get(mvglobals.RESOLUTION, (None, []))
+		if mtime != cachedMtime:
+			posList = self.compilePositionsFile(posFile, 1.5 if mvglobals.RESOLUTION == "FHD" else 1.0)
+			self.positionsCache[mvglobals.RESOLUTION] = (mtime, posList)
+		return posList
+
+	def compilePositionsFile(self, posFile, scale):
+		posList = []
+		with open(posFile) as posData:
+			for line in posData:
+				line = line.split("#")[0].strip()
+				if not line:
+					continue  # skip comments
+				columns = [item.replace("(", "").replace(")", "").strip() for item in line.split(":")[1].split(";")] if ":" in line else []
+				posList.append(tuple(tuple(int(int(value.strip()) * scale) for value in item.split(",")) for item in columns))
+		return posList
+
+	def getCursorPixmap(self, filename):
+		pixKey = (mvglobals.RESOLUTION, filename)
+		if pixKey not in self.cursorPixmaps:  # decode each cursor PNG only once per resolution
+			self.cursorPixmaps[pixKey] = LoadPixmap(cached=True, path=f"{mvglobals.PLUGINPATH}/pics/{mvglobals.RESOLUTION}/{filename}")
+		return self.cursorPixmaps[pixKey]
+
+	@mvstats.timed("serviceUpdated")
+	def serviceUpdated(self, refresh=True):
+		self.audioInfoTimer.stop()
+		currAudioDict = self.getAudioTracks(refresh)
+		currTrack = currAudioDict.get("currTrack")
+		tracks = currAudioDict.get("tracks", [])
+		audioText = tracks[currTrack] if tracks else "keine Audiospuren gefunden"
+		audioText = audioText if audioText else "keine Audiospurbenennung gefunden"
+		self.showAudioText(audioText)
+
+	def getAudioTracks(self, refresh=True):  # refresh=False trusts the cached track names as long as the number of tracks is unchanged
+		currAudioDict = {}
+		currService = self.session.nav.getCurrentService()
+		if currService:
+			try:
+				audioTracks = currService.audioTracks()
+				trackNumber = audioTracks.getNumberOfTracks()
+				if trackNumber:
+					serviceRef = self.session.nav.getCurrentlyPlayingServiceReference()
+					serviceKey = serviceRef.toString() if serviceRef else ""
+					cachedPids, tracks = self.audioCache.get(serviceKey, ((), []))
+					if refresh or len(tracks) != trackNumber:
+						trackInfos = [audioTracks.getTrackInfo(track) for track in range(trackNumber)]
+						pids = tuple(trackInfo.getPID() for trackInfo in trackInfos)
+						if pids != cachedPids:  # new service or changed audio PIDs
+							tracks = [trackInfo.getLanguage() for trackInfo in trackInfos]
+							self.audioCache[serviceKey] = (pids, tracks)
+					currAudioDict["tracks"] = tracks
+					currAudioDict["currTrack"] = audioTracks.getCurrentTrack()
+			except Exception:
+				pass
+		return currAudioDict
+
+	def showCursor(self, cursorIndex):
+		if self.multiviewActive:
+			filename = "cursor_right.png" if cursorIndex else "cursor_left.png"
+			if filename != self.cursorFile:
+				self["mvcursor"].instance.setPixmap(self.getCursorPixmap(filename))
+				self.cursorFile = filename
+			maxChannels = len(self.channels) - 1
+			currPositions = self.positions[maxChannels] if maxChannels < len(self.positions) else []
+			xpos, ypos = currPositions[cursorIndex]
+			self["mvcursor"].setPosition(xpos, ypos)
+			self["mvcursor"].show()
+		else:
+			self.hideCursor()
+
+	def hideCursor(self):
+		self["mvcursor"].hide()
+
+	def showAudioText(self, audioText, timeout=5000):
+		self.audioTimer.start(timeout)
+		self["audiotext"].setText(audioText)
+
+	def hideAudioText(self):
+		self.audioTimer.stop()
+		self["audiotext"].setText("")
+
+	def showColorKeys(self):
+		self["key_red"].setText("Konferenz 1" if len(self.conferences) > 0 else "")
+		self["key_green"].setText("Konferenz 2" if len(self.conferences) > 1 else "")
+		self["key_yellow"].setText("Audiokanäle")
+
+	def hideColorKeys(self):
+		self["key_red"].setText("")
+		self["key_green"].setText("")
+		self["key_yellow"].setText("")
+
+	def showExitText(self, exitText, timeout=4000):
+		self.exitTimer.start(timeout)
+		self["exittext"].setText(exitText)
+
+	def hideExitText(self):
+		self.exitTimer.stop()
+		self["exittext"].setText("")
+
+	def showMVactive(self):
+		self["mvtext"].setText("Multiview")
+
+	def hideMVactive(self):
+		self["mvtext"].setText("")
+
+	def keyOk(self):
+		if self.multiviewActive:
+			self.channelSelect(self.currCursorIndex)
+		else:
+			self.backToMultiview()
+
+	def keyExit(self):
+		if self.multiviewActive:
+			self.hideAudioText()
+			self.hideColorKeys()
+			self.hideExitText()
+			self.hideCursor()
+			self.hide()
+			self.escape()
+		else:
+			self.backToMultiview()
+
+	def backToMultiview(self):
+			if self.mvRef:
+				self.multiviewActive = True
+				self.hideAudioText()
+				self.hideColorKeys()
+				self.hideExitText()
+				self.mvInfobox.showDialog(f"Schalte zurück zur Multiview-Übersicht:\n{self.mvEntry['mvSname']}")
+				self.zapTo(self.mvRef, self.mvEntry["mvSname"])
+				self.showMVactive()
+				self.showColorKeys()
+				self.showCursor(self.currCursorIndex)
+
+	def zapTo(self, serviceRef, serviceName, debounce=True):  # cursor and infobox react at once, the tuner only gets the final target
+		self.zapTarget = (serviceRef, serviceName, time())
+		if debounce:
+			self.zapTimer.start(mvglobals.ZAPDELAY, True)
+		else:
+			self.zapNow()
+
+	def zapNow(self):
+		self.zapTimer.stop()
+		if self.zapTarget:
+			serviceRef, serviceName, pressTs = self.zapTarget
+			self.zapTarget = None
+			if serviceRef != self.session.nav.getCurrentlyPlayingServiceReference():  # e.g. OK pressed twice: back where we were
+				self.zapMeasure = (serviceName, pressTs, time())
+				self.session.nav.playService(serviceRef)
+
+	def serviceStarted(self):
+		if self.zapMeasure:
+			serviceName, pressTs, tuneTs = self.zapMeasure
+			self.zapMeasure = None
+			zapMs = (time() - pressTs) * 1000  # key press until the service has started, debounce included
+			mvstats.add("zap", zapMs)
+			mvstats.add(f"zap {serviceName}", zapMs)  # per target, kept across the starts of MVmain
+			mvstats.add("zap tune", (time() - tuneTs) * 1000)  # without the debounce
+		self.serviceInfoUpdated()
+
+	def serviceInfoUpdated(self):
+		self.audioInfoTimer.start(mvglobals.AUDIODELAY, True)  # a settling stream sends bursts of updates, redraw once it is quiet
+
+	def escape(self):
+		self.zapTimer.stop()
+		self.audioInfoTimer.stop()
+		self.zapTarget = None
+		if self.startChannel:
+			self.session.nav.playService(self.startChannel)
+		self.multiviewActive = False
+		self.close()
+
+	def keyLeft(self):
+		if self.multiviewActive:
+			self.currCursorIndex = 0
+			self.showCursor(self.currCursorIndex)
+
+	def keyRight(self):
+		self.keyDown()
+
+	def keyUp(self):
+		if self.multiviewActive:
+			self.currCursorIndex = (self.currCursorIndex - 1) % len(self.channels)
+			self.showCursor(self.currCursorIndex)
+
+	def keyDown(self):
+		if self.multiviewActive:
+			self.currCursorIndex = (self.currCursorIndex + 1) % len(self.channels)
+			self.showCursor(self.currCursorIndex)
+
+	def keyRed(self):
+		if self.multiviewActive and len(self.conferences) > 0:
+			self.hideAudioText()
+			self.hideExitText()
+			self.hideCursor()
+			self.hideMVactive()
+			self.multiviewActive = True
+			serviceName = self.conferences[0].epgSname
+			if self.conferences[0].epgSref:
+				self.multiviewActive = False
+				self.mvInfobox.showDialog(f"Schalte um auf Konferenz 1:\n{serviceName}")
+				self.zapTo(self.conferenceRefs[0], serviceName)
+				self.showExitText("'OK / EXIT' zurück zur Multiview-Übersicht")
+
+	def keyGreen(self):
+		if self.multiviewActive and len(self.conferences) > 1:
+			self.hideAudioText()
+			self.hideExitText()
+			self.hideCursor()
+			self.hideMVactive()
+			self.multiviewActive = True
+			serviceName = self.conferences[1].epgSname
+			if self.conferences[1].epgSref:
+				self.multiviewActive = False
+				self.mvInfobox.showDialog(f"Schalte um auf Konferenz 2:\n{serviceName}")
+				self.zapTo(self.conferenceRefs[1], serviceName)
+				self.showExitText("'OK / EXIT' zurück zur Multiview-Übersicht")
+
+	def keyYellowShort(self):
+		currAudioDict = self.getAudioTracks(refresh=False)
+		currTrack = currAudioDict.get("currTrack")
+		tracks = currAudioDict.get("tracks", [])
+		if tracks:
+			newTrack = (currTrack + 1) % len(tracks)
+			self.session.nav.getCurrentService().audioTracks().selectTrack(newTrack)
+		self.serviceUpdated(refresh=False)
+
+	def keyYellowLong(self):
+		self.session.openWithCallback(self.keyYellowCB, AudioSelection, infobar=self)
+
+	def keyYellowCB(self, answer):
+		self.serviceUpdated()
+
+	def keyMenu(self):
+		if self["key_yellow"].getText():
+			self.hideColorKeys()
+		else:
+			self.showColorKeys()
+
+	def key1(self):
+		self.channelSelect(0, 1)
+
+	def key2(self):
+		self.channelSelect(1, 2)
+
+	def key3(self):
+		self.channelSelect(2, 3)
+
+	def key4(self):
+		self.channelSelect(3, 4)
+
+	def key5(self):
+		self.channelSelect(4, 5)
+
+	def key6(self):
+		self.channelSelect(5, 6)
+
+	def key7(self):
+		self.channelSelect(6, 7)
+
+	def key8(self):
+		self.channelSelect(7, 8)
+
+	def key9(self):
+		self.channelSelect(8, 9)
+
+	@mvstats.timed("channelSelect")
+	def channelSelect(self, cursorIndex, numberPressed=0):
+		if self.multiviewActive:
+			if cursorIndex < len(self.channels):
+				if not numberPressed or numberPressed == self.currCursorIndex + 1:
+					self.multiviewActive = False
+					self.hideCursor()
+					self.hideAudioText()
+					self.hideColorKeys()
+					serviceName = self.channels[cursorIndex].epgSname
+					self.mvInfobox.showDialog(f"Schalte um auf Kanal '{cursorIndex + 1}':\n{serviceName}")
+					self.zapTo(self.channelRefs[cursorIndex], serviceName)
+					self.showExitText("'OK / EXIT' zurück zur Multiview-Übersicht")
+				else:
+					self.currCursorIndex = cursorIndex
+					self.showCursor(cursorIndex)
+			else:
+				self.mvInfobox.showDialog(f"Kanal '{cursorIndex + 1}' hat zur Zeit keine\nMultiview-Übertragung.")
+
+	def createSummary(self):
+		return MVlcdcreen
+
+
+class MVeventSelect(Screen, MVhelpers):
+	skin = """
+	<screen name="MVeventSelect" position="center,center" size="1140,644" resolution="1280,720" flags="wfNoBorder" title="Multiview-Eventauswahl" backgroundColor="transparent">
+		<widget source="Title" render="Label" position="140,24" size="400,40" font="Regular; 27" textBorderColor="#00505050" textBorderWidth="1" foregroundColor="#00ffff00" backgroundColor="#16000000" valign="center" halign="left" zPosition="12" transparent="1" />
+		<widget source="release" render="Label" position="24,622" size="50,20" font="Regular;16" foregroundColor="#005e03" backgroundColor="#000000" valign="center" zPosition="12" transparent="1" halign="center" />
+		<widget source="global.CurrentTime" render="Label" position="992,16" size="140,60" font="Regular;46" noWrap="1" halign="center" valign="bottom" foregroundColor="white" backgroundColor="#16000000" cornerRadius="3" zPosition="12" transparent="1">
+			<convert type="ClockToText">Default</convert>
+		</widget>
+		<widget source="global.CurrentTime" render="Label" position="889,22" size="100,26" font="Regular;16" noWrap="1" halign="right" valign="bottom" foregroundColor="white" backgroundColor="#16000000" zPosition="12" transparent="1">
+			<convert type="ClockToText">Format:%A</convert>
+		</widget>
+		<widget source="global.CurrentTime" render="Label" position="889,42" size="100,26" font="Regular;16" noWrap="1" halign="right" valign="bottom" foregroundColor="white" backgroundColor="#16000000" zPosition="12" transparent="1">
+			<convert type="ClockToText">Format:%e. %B</convert>
+		</widget>
+		<eLabel text="von Mr.Servo - Skin von stein17 " position="100,622" size="320,20" font="Regular;16" foregroundColor="#005e03" backgroundColor="#000000" transparent="1" zPosition="2" halign="left" />
+		<widget source="key_blue" render="Pixmap" pixmap="~key_blue.png" position="900,622" size="20,20" scale="1" alphatest="blend" zPosition="12" objectTypes="key_blue,StaticText" transparent="1">
+			<convert type="ConditionalShowHide" />
+		</widget>
+		<widget source="key_blue" render="Label" position="926,622" size="200,20" font="Regular;16" noWrap="1" valign="center" halign="left" foregroundColor="grey" backgroundColor="#000000" zPosition="12" objectTypes="key_blue,StaticText" transparent="1" />
+		<eLabel name="fullscreen_bg" position="0,80" size="1140,564" backgroundColor="#16002a01,#16010001,#16000000,vertical" zPosition="-8" />
+		<eLabel name="title_bg" position="0,10" size="1140,78" backgroundColor="#16008c03,#16002a01,#16000000,horizontal" zPosition="-9" cornerRadius="12" />
+		<eLabel name="line" position="0,78" size="1140, 2" backgroundColor="#002a01,#008c03,#002a01,horizontal" zPosition="2" />
+		<eLabel name="line" position="16,260" size="1088, 1" backgroundColor="#002a01,#008c03,#002a01,horizontal" zPosition="2" />
+		<eLabel name="line" position="16,440" size="1088, 1" backgroundColor="#002a01,#008c03,#002a01,horizontal" zPosition="2" />
+		<eLabel name="line" position="16,620" size="1088, 1" backgroundColor="#002a01,#008c03,#002a01,horizontal" zPosition="2" />
+		<ePixmap pixmap="~plugin.png" position="16,26" size="100,40" alphatest="blend" transparent="1" zPosition="2"/>
+		<widget source="menulist" render="Listbox" position="10,80" size="1120,540" enableWrapAround="1" backgroundColor="#15151515" foregroundColor="#dbe1e4" itemCornerRadiusSelected="12" itemGradientSelected="#008c03,#002a01,#002a01,horizontal"
+		foregroundColorSelected="#d7d7d7" backgroundColorSelected="#16008c03" scrollbarMode="showOnDemand" scrollbarBorderWidth="1" scrollbarWidth="10" scrollbarBorderColor="#007302" scrollbarForegroundColor="#002c01" transparent="1">
+			<convert type="TemplatedMultiContent">{"template": [  # index 0 ('mvSref') is not used in skin!
+				MultiContentEntryPixmapAlphaBlend(pos=(10,12), size=(36,36), flags=BT_HALIGN_LEFT|BT_VALIGN_CENTER, png=11),  # logos
+				MultiContentEntryText(pos=(60,16), size=(380,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP|RT_WRAP, text=7),  # mvCountdown
+				MultiContentEntryText(pos=(60,16), size=(60,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP|RT_WRAP, text=3),  # progessStart
+				MultiContentEntryProgress(pos=(124,24), size=(130,10), borderWidth=1, foreColor=0xcbcbcb, percent=-5),  # mvProgress
+				MultiContentEntryText(pos=(270,16), size=(60,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP|RT_WRAP, text=4),  # progessEnd
+				MultiContentEntryText(pos=(340,16), size=(120,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP|RT_WRAP, text=6),  # mvRemaining
+				MultiContentEntryPixmapAlphaBlend(pos=(10,54), size=(90,54), flags=BT_HALIGN_LEFT|BT_VALIGN_CENTER|BT_SCALE, png=10),  # picons
+				MultiContentEntryText(pos=(112,64), size=(330,38), font=0, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP, text=1),  # mvSname
+				MultiContentEntryText(pos=(12,112), size=(520,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP, text=2),  # mvEvent
+				MultiContentEntryText(pos=(12,142), size=(400,30), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_TOP|RT_WRAP, text=8),  # mvTimeline
+				MultiContentEntryText(pos=(540,0), size=(580,180), font=1, flags=RT_HALIGN_LEFT|RT_VALIGN_CENTER , text=9),  # mvCommon
+				],
+					"fonts": [gFont("Regular",27), gFont("Regular",22), gFont("Regular",18)],
+					"itemHeight":180
+					}
+			</convert>
+		</widget>
+	</screen>
+	"""
+	def __init__(self, session):
+		self.skin = self.skin.replace("~", f"{mvglobals.PLUGINPATH}/pics/{mvglobals.RESOLUTION}/")
+		Screen.__init__(self, session)
+		mvstats.setup()
+		self._instance = self.getEPGinstance()
+		self.refreshTimer = eTimer()
+		self.epgTimer = eTimer()
+		self.mvInfobox = session.instantiateDialog(MVinfoBox)
+		self.mvStatsOverlay = None  # hidden debug overlay, key MENU toggles it while the stats are enabled
+		self.mvRecords = []
+		self.teamIndex = MVteamIndex([])
+		self.teamQuery = ""  # last search of key BLUE
+		self.staticRows = {}  # {mvTupleId: (mvRecord, staticRow)}
+		self.rowsDate = None
+		self.cacheFingerprint = ""
+		self.refreshJob = 0  # incremented to cancel a refresh in flight
+		self.refreshBusy, self.refreshPending = False, False
+		self.refreshTs, self.streamTs = 0, 0
+		self["release"] = StaticText(mvglobals.RELEASE)
+		self["headline"] = StaticText("Starte laufende Multiview Veranstaltung:")
+		self["key_blue"] = StaticText("Spiel suchen")
+		self["menulist"] = List()
+		self["actions"] = ActionMap(["OkCancelActions", "MenuActions", "ColorActions"], {
+			"ok": self.keyOk,
+			"cancel": self.keyExit,
+			"menu": self.keyMenu,
+			"blue": self.keyBlue
+		}, -1)
+		self["menulist"].onSelectionChanged.append(self.selectionChanged)
+		self.refreshTimer.callback.append(self.updateMenulist)
+		self.epgTimer.callback.append(self.refreshMenulist)
+		self.onLayoutFinish.append(self.layoutFinished)
+		self.onClose.append(self.cancelRefresh)
+
+	def layoutFinished(self):
+		self["menulist"].setList([])
+		nowTs = time()
+		warmRecords = [mvRecord for mvRecord in mvwarmer.mvRecords if mvRecord.mvEnd > nowTs]  # evict ended multiviews
+		if len(warmRecords) == len(mvwarmer.mvRecords) and warmRecords:  # warm and unchanged: no cache file to read, no index to build
+			self.mvRecords, self.teamIndex = mvwarmer.mvRecords, mvwarmer.teamIndex
+		elif warmRecords:
+			self.mvRecords, self.teamIndex = warmRecords, MVteamIndex(warmRecords)
+		else:
+			self.mvRecords = self.readCacheFile()
+			self.teamIndex = MVteamIndex(self.mvRecords)
+		if self.mvRecords:  # show the last known multiviews until the EPG has been read
+			self.updateMenulist()
+		self.refreshMenulist()
+
+	def refreshMenulist(self):
+		if self.refreshBusy:
+			self.refreshPending = True  # coalesce all requests into one more refresh after the running one
+		else:
+			self.refreshBusy, self.refreshPending = True, False
+			self.refreshTs = self.streamTs = mvstats.start()
+			self.epgTimer.stop()
+			callInThread(self.refreshWorker, self.refreshJob, self.mvRecords, self["menulist"].getIndex())
+
+	def refreshWorker(self, refreshJob, shownRecords, index):  # runs in a reactor worker thread, must not touch any widget or timer
+		def streamRecord(mvRecord):  # show the multiviews matched so far together with the shown ones that are not confirmed yet
+			nonlocal streamTs
+			streamRecords[mvRecord.mvTupleId] = mvRecord
+			if refreshJob == self.refreshJob and time() - streamTs >= mvglobals.STREAMINTERVAL:
+				streamTs = time()
+				partRecords = sorted((mvRecord for mvRecord in streamRecords.values() if mvRecord.mvEnd > streamTs), key=itemgetter(0))  # shown ones may have ended
+				callFromThread(self.refreshPartial, refreshJob, partRecords, MVteamIndex(partRecords), *self.buildMenulist(partRecords, streamTs, reuseRows, index), streamTs)
+
+		mvRecords, teamIndex, staticRows, menuList, nowTs = [], None, {}, None, 0
+		try:
+			reuseRows = not mvpixmaps.checkDirectories()  # rows hold the pixmaps of the old picons
+			streamRecords, streamTs = {mvRecord.mvTupleId: mvRecord for mvRecord in shownRecords}, 0
+			if refreshJob == self.refreshJob:
+				mvRecords = self.getEPGmvRecords(streamRecord)
+			if refreshJob == self.refreshJob:  # skip the rest if cancelled during the EPG search
+				self.writeCacheFile(mvRecords)
+				teamIndex = MVteamIndex(mvRecords)
+				nowTs = time()
+				staticRows, menuList = self.buildMenulist(mvRecords, nowTs, reuseRows, index)
+		except Exception as error:  # e.g. an EPG error, the rows stay as they are and the next pass tries again
+			print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'refreshWorker': {error}")
+			menuList = None
+		finally:
+			callFromThread(self.refreshFinished, refreshJob, mvRecords, teamIndex, staticRows, menuList, nowTs)  # always, or 'refreshBusy' would block every later refresh
+
+	def refreshPartial(self, refreshJob, mvRecords, teamIndex, staticRows, menuList, nowTs):  # back in the reactor thread, the EPG search is still running
+		if refreshJob == self.refreshJob:
+			self.mvRecords, self.teamIndex = mvRecords, teamIndex  # MVmain can already be started for every row shown
+			self.showMenulist(staticRows, menuList, nowTs)
+			mvstats.stop("firstRows", self.streamTs)  # from the request until the first matched multiview is shown
+			self.streamTs = 0
+
+	def refreshFinished(self, refreshJob, mvRecords, teamIndex, staticRows, menuList, nowTs):  # back in the reactor thread
+		self.refreshBusy = False
+		if refreshJob == self.refreshJob:
+			if menuList is not None:
+				self.mvRecords, self.teamIndex = mvRecords, teamIndex
+				mvwarmer.publish(mvRecords, teamIndex)
+				self.showMenulist(staticRows, menuList, nowTs)
+				mvstats.stop("refreshMenulist", self.refreshTs)  # from the request until the rows are shown, EPG search included
+				if self.mvStatsOverlay and self.mvStatsOverlay.isVisible:
+					self.mvStatsOverlay.showDialog(mvstats.getText())
+			self.epgTimer.startLongTimer(mvglobals.EPGINTERVAL)  # after a failed pass as well
+		if self.refreshPending:
+			self.refreshMenulist()
+
+	def cancelRefresh(self):
+		self.refreshTimer.stop()
+		self.epgTimer.stop()
+		self.refreshJob += 1
+		self.refreshPending = False
+
+	def readCacheFile(self):
+		mvRecords = []
+		if exists(mvglobals.CACHEFILE):
+			try:
+				with open(mvglobals.CACHEFILE) as file:
+					cacheData = load(file)
+				self.cacheFingerprint = cacheData.get("fingerprint", "")
+				nowTs = time()
+				mvRecords = [mvRecord for mvRecord in map(MVoverview.fromJSON, cacheData.get("mvRecords", [])) if mvRecord.mvEnd > nowTs]  # evict ended multiviews
+			except (OSError, ValueError, AttributeError, TypeError) as error:
+				print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'readCacheFile': {error}")
+		return mvRecords
+
+	def writeCacheFile(self, mvRecords):
+		fingerprint = f"{crc32(dumps(mvRecords).encode()):08x}"
+		if fingerprint != self.cacheFingerprint:  # spare the flash memory, write only if the EPG data has changed
+			try:
+				with open(f"{mvglobals.CACHEFILE}.tmp", "w") as file:
+					dump({"timestamp": int(time()), "fingerprint": fingerprint, "mvRecords": mvRecords}, file, separators=(",", ":"))
+				replace(f"{mvglobals.CACHEFILE}.tmp", mvglobals.CACHEFILE)
+				self.cacheFingerprint = fingerprint
+			except OSError as error:
+				print(f"[{mvglobals.MODULE_NAME}] ERROR in module 'writeCacheFile': {error}")
+
+	def updateMenulist(self):
+		nowTs = time()
+		mvRecords = [mvRecord for mvRecord in self.mvRecords if mvRecord.mvEnd > nowTs]  # the end boundary has fired: evict ended multiviews
+		if len(mvRecords) != len(self.mvRecords):  # a new list, the old one may be shared with MVwarmer and 'matchCache'
+			self.mvRecords, self.teamIndex = mvRecords, MVteamIndex(mvRecords)
+		staticRows, menuList = self.buildMenulist(self.mvRecords, nowTs, index=self["menulist"].getIndex())
+		self.showMenulist(staticRows, menuList, nowTs)
+
+	@mvstats.timed("buildMenulist")
+	def buildMenulist(self, mvRecords, nowTs, reuseRows=True, index=0):  # reads the row cache but leaves it untouched, MVpixmaps locks its own caches, so it is safe in a worker thread
+		today = datetime.fromtimestamp(nowTs).date()
+		cachedRows = self.staticRows if reuseRows and today == self.rowsDate else {}  # the timeline says 'heute' or the weekday, so it has to be rebuilt on a new day
+		staticRows, menuList = {}, []
+		if mvRecords:
+			for rowIndex, mvRecord in enumerate(mvRecords):
+				mvTupleId = mvRecord.mvTupleId
+				if not self.isNearRow(rowIndex, index, len(mvRecords)):  # far away from the visible rows: no pixmaps, no texts
+					menuList.append(self.createPlaceholderRow(mvRecord))
+					continue
+				cachedRecord, staticRow = cachedRows.get(mvTupleId, (None, None))
+				if cachedRecord != mvRecord:  # build static row parts only for new or changed EPG data
+					staticRow = self.createStaticRow(mvTupleId, mvRecord, nowTs)
+				staticRows[mvTupleId] = (mvRecord, staticRow)
+				menuList.append(self.createMenuRow(staticRow, nowTs))
+		else:
+			mvChannels = "{keine Einzelsendung gefunden}\n{keine Konferenz gefunden}"
+			menuList.append(("", "kein Multiview gefunden", "", "", "", -1, "", "", "", mvChannels, None, None, None))
+		return staticRows, menuList
+
+	@mvstats.timed("showMenulist")
+	def showMenulist(self, staticRows, menuList, nowTs):
+		self.staticRows, self.rowsDate = staticRows, datetime.fromtimestamp(nowTs).date()
+		currList = self["menulist"].list
+		if [row[-1] for row in currList] == [row[-1] for row in menuList]:  # same rows as before: update changed rows only
+			for index, row in enumerate(menuList):
+				if row != currList[index]:
+					self["menulist"].modifyEntry(index, row)
+		else:
+			self["menulist"].updateList(menuList)
+		if not self.materializeRows(self["menulist"].getIndex()):  # the selection may have moved while the rows were built in the worker
+			self.startRefreshTimer(nowTs)
+
+	def selectionChanged(self):
+		self.materializeRows(self["menulist"].getIndex())
+
+	def materializeRows(self, index):  # build the placeholders that have come near the selection, returns True if there were any
+		count, newRows, nowTs = len(self.mvRecords), {}, time()
+		for rowIndex in sorted({(index + offset) % count for offset in range(-mvglobals.ROWWINDOW, mvglobals.ROWWINDOW + 1)} if count else ()):
+			mvRecord = self.mvRecords[rowIndex]
+			mvTupleId = mvRecord.mvTupleId
+			if mvTupleId not in self.staticRows and mvTupleId not in newRows:
+				newRows[mvTupleId] = (mvRecord, self.createStaticRow(mvTupleId, mvRecord, nowTs))
+				self["menulist"].modifyEntry(rowIndex, self.createMenuRow(newRows[mvTupleId][1], nowTs))
+		if newRows:
+			self.staticRows = {**self.staticRows, **newRows}  # a new dict, the worker thread may be reading the old one
+			self.startRefreshTimer(nowTs)
+		return bool(newRows)
+
+	def isNearRow(self, rowIndex, index, count):  # the listbox wraps around, so the last rows are near the first ones
+		distance = abs(rowIndex - index)
+		return min(distance, count - distance) <= mvglobals.ROWWINDOW
+
+	def startRefreshTimer(self, nowTs):
+		nextTs = self.getNextBoundary(nowTs)
+		if nextTs:
+			self.refreshTimer.start(int((nextTs - nowTs) * 1000) + 50, True)  # +50ms: wake up just behind the boundary
+		else:
+			self.refreshTimer.stop()
+
+	def getNextBoundary(self, nowTs):  # next instant at which any built row of the menulist will look different, placeholders never change
+		boundaries = []
+		for mvRecord, staticRow in self.staticRows.values():
+			mvStart, mvDurance, mvEnd = mvRecord.mvStart, mvRecord.mvDurance, mvRecord.mvEnd
+			if nowTs < mvStart:  # next countdown minute ('startet gleich...' included), the start itself switches to 'live'
+				boundaries.append(mvStart - (-(-(mvStart - nowTs) // 60) - 1) * 60)
+			elif nowTs < mvEnd:  # next remaining minute, next progress step, the end itself
+				boundaries.append(mvEnd - (-(-(mvEnd - nowTs) // 60) - 1) * 60)
+				boundaries.append(mvStart + mvDurance * (int((nowTs - mvStart) / mvDurance * 100) + 1) / 100)
+		if boundaries:  # the timeline switches from weekday to 'heute' at midnight
+			boundaries.append(datetime.combine(datetime.fromtimestamp(nowTs).date() + timedelta(days=1), datetime.min.time()).timestamp())
+		return min(boundaries) if boundaries else 0
+
+	def createStaticRow(self, mvTupleId, mvRecord, nowTs):
+		mvId, mvSref, mvStart = mvTupleId
+		mvSname, mvEvent, mvDurance, mvEnd = mvRecord.mvSname, mvRecord.mvEventText, mvRecord.mvDurance, mvRecord.mvEnd
+		livePix = mvpixmaps.getLogo(mvclassifier.classify(mvId).logo)
+		noLivePix = mvpixmaps.getLogo("no_live.png")
+		piconPix = mvpixmaps.getPicon(mvSref, mvRecord.channelNo)
+		mvChannels, mvConferences = [], []
+		for index, channel in enumerate(mvRecord.channels):
+			mvChannels.append(f"Sendung {index + 1}: {channel.epgCaption}")
+		if not mvChannels:
+			mvChannels = ["{keine Einzelsendung gefunden}"]
+		for conference in mvRecord.conferences:
+			mvConferences.append(f"Konferenz: {conference.epgCaption}")
+		if not mvConferences:
+			mvConferences = ["{keine Konferenz gefunden}"]
+		mvCommon = "\n".join(mvChannels + mvConferences)
+		mvStartDt = datetime.fromtimestamp(mvStart)
+		mvStartStr = mvStartDt.strftime("%H:%M Uhr")
+		isToday = datetime.fromtimestamp(nowTs).date() != mvStartDt.date()
+		mvWeekday = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"][mvStartDt.weekday()] if isToday else "heute"
+		mvDuranceStr = f"Dauer: {int(mvDurance / 60)} Minuten"
+		mvTimeline = f"{mvWeekday}, {mvStartStr}, {mvDuranceStr}"
+		progressStart = mvStartDt.strftime("%H:%M")
+		progressEnd = datetime.fromtimestamp(mvEnd).strftime("%H:%M")
+		return {"mvSref": mvSref, "mvSname": mvSname, "mvEvent": mvEvent, "mvStart": mvStart, "mvEnd": mvEnd, "progressStart": progressStart, "progressEnd": progressEnd,
+				"mvTimeline": mvTimeline, "mvCommon": mvCommon, "piconPix": piconPix, "livePix": livePix, "noLivePix": noLivePix, "mvTupleId": mvTupleId}
+
+	def createPlaceholderRow(self, mvRecord):  # same row format, replaced by 'materializeRows()' before it gets visible
+		return (mvRecord.mvSref, mvRecord.mvSname, "", "", "", -1, "", "", "", "", None, None, mvRecord.mvTupleId)
+
+	def createMenuRow(self, staticRow, nowTs):
+		mvStart, mvEnd = staticRow["mvStart"], staticRow["mvEnd"]
+		if nowTs > mvStart and nowTs < mvEnd:  # enable progressbar and start/end, disable countdown, show logo 'running'
+			progressStart, progressEnd = staticRow["progressStart"], staticRow["progressEnd"]
+			mvRemaining = f"+{int((mvEnd - nowTs) / 60)} Min"
+			mvProgress = int((nowTs - mvStart) / (mvEnd - mvStart) * 100)
+			mvCountdown = ""
+			logoPix = staticRow["livePix"]
+		else:  # disable progressbar and time, enable countdown, show logo 'not running'
+			progressStart, progressEnd, mvRemaining, mvProgress = "", "", "", -1
+			mvCountdown = self.countDownText(mvStart - nowTs)
+			logoPix = staticRow["noLivePix"]
+		return (staticRow["mvSref"], staticRow["mvSname"], staticRow["mvEvent"], progressStart, progressEnd, mvProgress, mvRemaining, mvCountdown,
+				staticRow["mvTimeline"], staticRow["mvCommon"], staticRow["piconPix"], logoPix, staticRow["mvTupleId"])
+
+	def countDownText(self, durance):
+		countdown = ""
+		if durance > 0:  # ended multiviews are evicted by 'updateMenulist()'
+			mins, secs = divmod(durance, 60)
+			hours, mins = divmod(mins, 60)
+			days, hours = divmod(hours, 24)
+			if days or hours or mins > 1:
+				countdown += "noch "
+				dayType = "Tag" if days == 1 else "Tage"
+				countdown += f"{int(days)} {dayType}, " if days else ""
+				countdown += f"{int(hours)} Stunden, " if hours else ""
+				countdown += f"{int(mins)} Minuten"
+			else:
+				countdown += "startet gleich..."
+		return countdown
+
+	def keyOk(self):
+		current = self["menulist"].getCurrent()
+		if current and self.mvRecords:
+			self.cancelRefresh()  # MVmain works with the current mvRecords, a refresh in flight would be wasted
+			self.session.openWithCallback(self.keyOkCB, MVmain, current[-1], self.getMVindex(), self.mvInfobox)  # [-1] is mvTupleId
+
+	def keyOkCB(self, answer=None):
+		self.refreshMenulist()
+
+	def getMVindex(self):
+		return mvwarmer.getMVindex() if self.mvRecords is mvwarmer.mvRecords else self.createMVindex(self.mvRecords)  # e.g. while streaming
+
+	def keyBlue(self):
+		self.session.openWithCallback(self.keyBlueCB, VirtualKeyBoard, title="Team oder Spiel suchen, z.B. 'Bayern' oder 'Bayern - Dortmund'", text=self.teamQuery)
+
+	def keyBlueCB(self, query=None):
+		if query:
+			self.teamQuery = query
+			hits = self.teamIndex.find(query)
+			if hits:  # the soonest multiview first
+				mvTupleId, channelIndex = hits[0]
+				self.cancelRefresh()
+				self.session.openWithCallback(self.keyOkCB, MVmain, mvTupleId, self.getMVindex(), self.mvInfobox, channelIndex)
+			else:
+				self.mvInfobox.showDialog(f"Kein Spiel gefunden für:\n'{query}'", timeout=3000)
+
+	def keyMenu(self):
+		if mvstats.enabled:
+			if not self.mvStatsOverlay:
+				self.mvStatsOverlay = self.session.instantiateDialog(MVstatsOverlay)
+			if self.mvStatsOverlay.isVisible:
+				self.mvStatsOverlay.hideDialog()
+			else:
+				self.mvStatsOverlay.showDialog(mvstats.getText())
+
+	def keyExit(self):
+		self.session.deleteDialog(self.mvInfobox)
+		if self.mvStatsOverlay:
+			self.session.deleteDialog(self.mvStatsOverlay)
+		if mvstats.enabled:
+			mvstats.write()
+		self.close()
+
+
+class MVinfoBox(Screen):
+	skin = """
+	<screen name="MVinfoBox" position="390,432" size="500,110" flags="wfNoBorder" resolution="1280,720" title="Sky Multiview Infobox">
+		<eLabel position="0,0" size="500,110" backgroundColor="#002a01,#008c03,#002a01,horizontal" zPosition="-1"/>
+		<eLabel position="2,2" size="496,106" zPosition="-1"/>
+		<widget source="info" render="Label" position="5,5" size="490,100" font="Regular;24" halign="center" valign="center"/>
+	</screen>
+	"""
+
+	def __init__(self, session):
+		Screen.__init__(self, session)
+		self["info"] = StaticText()
+		self.isVisible = False
+		self.mvinfoTimer = eTimer()
+		self.mvinfoTimer.callback.append(self.hideDialog)
+
+	def showDialog(self, info, timeout=1500):
+		self["info"].setText(info)
+		self.isVisible = True
+		self.show()
+		if timeout:
+			self.mvinfoTimer.start(timeout, True)
+
+	def hideDialog(self):
+		self.mvinfoTimer.stop()
+		self.isVisible = False
+		self.hide()
+
+	def getIsVisible(self):
+		return self.isVisible
+
+
+class MVstatsOverlay(Screen):
+	skin = """
+	<screen name="MVstatsOverlay" position="20,20" size="700,300" flags="wfNoBorder" resolution="1280,720" title="Sky Multiview Stats" backgroundColor="#40000000">
+		<widget source="stats" render="Label" position="10,10" size="680,280" font="Regular;18" halign="left" valign="top" foregroundColor="#00ffff00" transparent="1"/>
+	</screen>
+	"""
+
+	def __init__(self, session):
+		Screen.__init__(self, session)
+		self["stats"] = StaticText()
+		self.isVisible = False
+
+	def showDialog(self, stats):
+		self["stats"].setText(stats)
+		self.isVisible = True
+		self.show()
+
+	def hideDialog(self):
+		self.isVisible = False
+		self.hide()
+
+
+class MVlcdcreen(Screen):
+	skin = """
+	<screen position="0,0" size="320,240" title="Sky Multiview">
+		<widget source="lcdanz1" render="Label" position="0,0" size="320,115" font="Regular;14" halign="left" valign="top"/>
+		<widget source="lcdanz2" render="Label" position="0,125" size="320,115" font="Regular;14" halign="center" valign="bottom"/>
+	</screen>
+	"""
+
+	def __init__(self, session, parent):
+		Screen.__init__(self, session)
+		self["lcdanz1"] = StaticText("Sky Multiview Plugin")
+		self["lcdanz2"] = StaticText("Screen: Multiview LCDScreen")
+
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+########################################################################################################
+# Benchmark for the SkyMultiview hot paths, runs off-box against the stand-ins from 'e2stubs.py' and   #
+# the synthetic EPG from 'skyepg.py'. Measures overview discovery, channel matching and menu row      #
+# construction and compares the median latency against the regression thresholds below.              #
+# usage: python3 tools/benchmark.py [-s saturday|weekend|stress|all] [-r REPEAT] [--legacy] [--check] #
+#        python3 tools/benchmark.py --replay epgrecord.jsonl [-r REPEAT]                              #
+########################################################################################################
+
+from argparse import ArgumentParser
+from json import loads
+from statistics import median
+import sys
+from time import perf_counter
+import tracemalloc
+
+import e2stubs
+import skyepg
+
+STAGES = ("discovery", "matching", "rows cold", "rows tick")
+THRESHOLDS = {  # median in ms, generous enough for a slow workstation, the STB itself is about 10x slower
+	"saturday": {"discovery": 0.5, "matching": 2.0, "rows cold": 2.0, "rows tick": 0.5},
+	"weekend": {"discovery": 0.5, "matching": 5.0, "rows cold": 4.0, "rows tick": 0.5},
+	"stress": {"discovery": 1.0, "matching": 15.0, "rows cold": 15.0, "rows tick": 1.0}
+}
+
+
+def measure(function, prepare, repeat):
+	timings = []
+	for _ in range(repeat):
+		args = prepare()
+		startTs = perf_counter()
+		function(*args)
+		timings.append((perf_counter() - startTs) * 1000)
+	args = prepare()  # one more run for the allocations, tracemalloc slows down the code too much for timing
+	e2stubs.FakeEPGCache.reset()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	result = function(*args)
+	current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	timings.sort()
+	return {"median": median(timings), "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))], "max": timings[-1],
+			"peak": (peak - before) / 1024, "kept": (current - before) / 1024, "queries": e2stubs.FakeEPGCache.queries}, result
+
+
+def runScenario(multiview, scenario, repeat, replayFile=None):
+	screen = multiview.MVeventSelect(e2stubs.Session())
+	if replayFile:  # a recording of real EPG searches from a box, see MVepgRecorder
+		with open(replayFile) as file:
+			nowTs = loads(file.readline()).get("recorded", 0)
+		screen._instance = multiview.MVepgReplay(replayFile)  # pylint: disable=protected-access
+		e2stubs.FakeEPGCache.load([])
+	else:
+		e2stubs.FakeEPGCache.load(skyepg.createScenario(scenario))
+		nowTs = skyepg.getNowTs(scenario)
+
+	def coldRows(mvRecords):
+		screen.staticRows, screen.rowsDate = {}, None
+		return screen.buildMenulist(mvRecords, nowTs)
+
+	results = {}
+	results["discovery"], overviews = measure(screen.findMultiviews, lambda: (nowTs,), repeat)
+	results["matching"], mvRecords = measure(screen.matchChannels, lambda: (overviews, nowTs), repeat)
+	results["rows cold"], (staticRows, menuList) = measure(coldRows, lambda: (mvRecords,), repeat)
+	screen.staticRows, screen.rowsDate = staticRows, None
+	screen.showMenulist(staticRows, menuList, nowTs)
+	results["rows tick"], _ = measure(screen.buildMenulist, lambda: (mvRecords, nowTs + 60), repeat)
+	events = {result for results in screen._instance.queries.values() for result in results} if replayFile else e2stubs.FakeEPGCache.events  # pylint: disable=protected-access
+	counters = {"events": len(events), "multiviews": len(mvRecords), "channels": sum(len(mvRecord.channels) + len(mvRecord.conferences) for mvRecord in mvRecords)}
+	return results, counters
+
+
+def main():
+	parser = ArgumentParser(description="SkyMultiview hot path benchmark")
+	parser.add_argument("-s", "--scenario", default="all", choices=skyepg.SCENARIOS + ("all",))
+	parser.add_argument("-r", "--repeat", type=int, default=50, help="timed runs per stage (default: 50)")
+	parser.add_argument("--legacy", action="store_true", help="one EPG query per overview instead of the bulk query")
+	parser.add_argument("--replay", metavar="FILE", help="measure a recording of MVepgRecorder instead of the synthetic EPG")
+	parser.add_argument("--check", action="store_true", help="exit with 1 if a median exceeds its threshold")
+	args = parser.parse_args()
+	e2stubs.install()
+	from SkyMultiview import multiview  # pylint: disable=import-outside-toplevel
+	multiview.MVglobals.BULKSEARCH = not args.legacy
+	regressions = []
+	if args.replay:
+		results, counters = runScenario(multiview, "stress", args.repeat, args.replay)  # a real EPG is measured against the largest thresholds
+		scenarios = {"replay": (results, counters, "stress")}
+	else:
+		scenarios = {scenario: (*runScenario(multiview, scenario, args.repeat), scenario) for scenario in (skyepg.SCENARIOS if args.scenario == "all" else (args.scenario,))}
+	for scenario, (results, counters, limits) in scenarios.items():
+		print(f"\n{scenario}: {counters['events']} EPG events, {counters['multiviews']} multiviews, {counters['channels']} matched broadcasts")
+		print(f"{'stage':<12}{'median':>10}{'p95':>10}{'max':>10}{'peak KiB':>10}{'kept KiB':>10}{'queries':>9}{'limit':>9}")
+		for stage in STAGES:
+			result, limit = results[stage], THRESHOLDS[limits][stage]
+			flag = ""
+			if result["median"] > limit:
+				flag = "  REGRESSION"
+				regressions.append(f"{scenario}/{stage}")
+			print(f"{stage:<12}{result['median']:>8.3f}ms{result['p95']:>8.3f}ms{result['max']:>8.3f}ms{result['peak']:>10.1f}{result['kept']:>10.1f}{result['queries']:>9}{limit:>7.1f}ms{flag}")
+	if regressions:
+		print(f"\nthresholds exceeded: {', '.join(regressions)}")
+	return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,313 @@
+########################################################################################################
+# Stand-ins for the enigma2 runtime, used by the SkyMultiview developer tools in this folder.          #
+# They replace eEPGCache, LoadPixmap, getPiconName, the Screen machinery and the twisted reactor, so   #
+# that 'multiview.py' can be imported and driven on an ordinary Linux machine. Not shipped with E2.    #
+########################################################################################################
+
+from os.path import abspath, dirname, join
+import sys
+from types import ModuleType, SimpleNamespace
+
+SRCPATH = join(dirname(dirname(abspath(__file__))), "src")
+PLUGINPATH = join(SRCPATH, "SkyMultiview/")
+
+
+class FakeEPGCache:
+	PARTIAL_TITLE_SEARCH = 1
+	events = []  # list of result tuples in 'IBDTSENRW' layout
+	queries = 0  # number of search() calls since the last reset()
+	scanned = 0  # number of result tuples handed out since the last reset()
+	_results = {}
+
+	@classmethod
+	def getInstance(cls):
+		return cls()
+
+	@classmethod
+	def load(cls, events):
+		cls.events = list(events)
+		cls._results = {}
+		cls.reset()
+
+	@classmethod
+	def reset(cls):
+		cls.queries, cls.scanned = 0, 0
+
+	def search(self, criteria):  # criteria = (SEARCH_FIELDS, MAX_RESULTS, PARTIAL_TITLE_SEARCH, query, CASE_INSENSITIVE_QUERY)
+		FakeEPGCache.queries += 1
+		results = FakeEPGCache._results.get(criteria)
+		if results is None:  # the EPG does not change during a run, so the scan of the real cache is not part of the measurement
+			maxResults, queryStr, caseInsensitive = criteria[1], criteria[3], criteria[4]
+			if caseInsensitive:
+				queryStr = queryStr.lower()
+				results = [event for event in FakeEPGCache.events if queryStr in event[3].lower()][:maxResults]
+			else:
+				results = [event for event in FakeEPGCache.events if queryStr in event[3]][:maxResults]
+			FakeEPGCache._results[criteria] = results
+		FakeEPGCache.scanned += len(results)
+		return list(results)
+
+
+class FakePixmap:
+	loads = 0  # number of LoadPixmap() calls that really decoded a file
+
+	def __init__(self, path):
+		self.path = path
+
+
+_pixmapCache = {}
+
+
+def LoadPixmap(path, desktop=None, cached=False, width=0, height=0, scaleSize=None):
+	pixmap = _pixmapCache.get(path) if cached else None
+	if pixmap is None:
+		FakePixmap.loads += 1
+		pixmap = FakePixmap(path)
+		if cached:
+			_pixmapCache[path] = pixmap
+	return pixmap
+
+
+def getPiconName(serviceRef):
+	return ""
+
+
+class eTimer:
+	def __init__(self):
+		self.callback = []
+		self.active = False
+		self.interval = 0
+
+	def start(self, msecs, singleShot=False):
+		self.active, self.interval = True, msecs
+
+	def startLongTimer(self, secs):
+		self.active, self.interval = True, secs * 1000
+
+	def stop(self):
+		self.active = False
+
+	def isActive(self):
+		return self.active
+
+	def fire(self):  # for the tools: run the callbacks as if the timer had expired
+		self.active = False
+		for callback in self.callback:
+			callback()
+
+
+class eServiceReference:
+	def __init__(self, ref):
+		self.ref = ref
+
+	def toString(self):
+		return self.ref
+
+	def __eq__(self, other):
+		return isinstance(other, eServiceReference) and other.ref == self.ref
+
+	def __hash__(self):
+		return hash(self.ref)
+
+
+class _Size:
+	def __init__(self, width, height):
+		self._width, self._height = width, height
+
+	def width(self):
+		return self._width
+
+	def height(self):
+		return self._height
+
+
+class _Desktop:
+	width, height = 1920, 1080
+
+	def size(self):
+		return _Size(self.width, self.height)
+
+
+def getDesktop(screen):
+	return _Desktop()
+
+
+class _Widget:
+	def __init__(self, *args, **kwargs):
+		self.visible = True
+		self.instance = SimpleNamespace(setPixmapFromFile=lambda path: None, setPixmap=lambda pixmap: None)
+		self.position = (0, 0)
+
+	def show(self):
+		self.visible = True
+
+	def hide(self):
+		self.visible = False
+
+	def setPosition(self, xpos, ypos):
+		self.position = (xpos, ypos)
+
+
+class StaticText:
+	def __init__(self, text=""):
+		self.text = text
+
+	def setText(self, text):
+		self.text = text
+
+	def getText(self):
+		return self.text
+
+
+class List:
+	def __init__(self, list=None):  # pylint: disable=redefined-builtin
+		self.list = list or []
+		self.index = 0
+		self.updates = 0  # number of full list updates
+		self.modifies = 0  # number of single row updates
+		self.onSelectionChanged = []
+
+	def setList(self, list):  # pylint: disable=redefined-builtin
+		self.list = list
+		self.updates += 1
+
+	updateList = setList
+
+	def modifyEntry(self, index, data):
+		self.list[index] = data
+		self.modifies += 1
+
+	def getCurrent(self):
+		return self.list[self.index] if self.index < len(self.list) else None
+
+	def getIndex(self):
+		return self.index
+
+	def setIndex(self, index):  # as if the user scrolled
+		self.index = index
+		for function in self.onSelectionChanged:
+			function()
+
+
+class Screen:
+	def __init__(self, session, parent=None):
+		self.session = session
+		self.widgets = {}
+		self.onLayoutFinish, self.onClose, self.onShown = [], [], []
+		self.visible = True
+		self.closed = False
+
+	def __setitem__(self, key, value):
+		self.widgets[key] = value
+
+	def __getitem__(self, key):
+		return self.widgets[key]
+
+	def show(self):
+		self.visible = True
+
+	def hide(self):
+		self.visible = False
+
+	def close(self, *retval):
+		self.closed = True
+		for callback in self.onClose:
+			callback()
+		if self.session:
+			self.session.closed(self, *retval)
+
+	def layoutFinished(self):  # for the tools: what enigma2 does after the skin has been applied
+		for callback in self.onLayoutFinish:
+			callback()
+
+
+class _Navigation:
+	def __init__(self):
+		self.playing = None
+		self.zaps = 0
+
+	def playService(self, ref):
+		self.playing = ref
+		self.zaps += 1
+
+	def getCurrentlyPlayingServiceReference(self):
+		return self.playing
+
+	def getCurrentService(self):
+		return None
+
+
+class Session:
+	def __init__(self):
+		self.nav = _Navigation()
+		self.dialogs = []
+		self.callbacks = {}
+
+	def instantiateDialog(self, screen, *args, **kwargs):
+		return screen(self, *args, **kwargs)
+
+	def deleteDialog(self, dialog):
+		pass
+
+	def open(self, screen, *args, **kwargs):
+		dialog = screen(self, *args, **kwargs)
+		self.dialogs.append(dialog)
+		dialog.layoutFinished()
+		return dialog
+
+	def openWithCallback(self, callback, screen, *args, **kwargs):
+		dialog = self.open(screen, *args, **kwargs)
+		self.callbacks[id(dialog)] = callback
+		return dialog
+
+	def closed(self, dialog, *retval):
+		if dialog in self.dialogs:
+			self.dialogs.remove(dialog)
+		callback = self.callbacks.pop(id(dialog), None)
+		if callback:
+			callback(*retval)
+
+
+class _Anything:  # MessageBox, AudioSelection, VirtualKeyBoard, ActionMap, ServiceEventTracker, PluginDescriptor: never inspected by the tools
+	TYPE_ERROR = 3
+	WHERE_PLUGINMENU, WHERE_EXTENSIONSMENU, WHERE_SESSIONSTART = 0, 1, 2
+
+	def __init__(self, *args, **kwargs):
+		self.args, self.kwargs = args, kwargs
+
+	def __getattr__(self, name):
+		return lambda *args, **kwargs: None
+
+
+def _addModule(name, **attributes):
+	module = ModuleType(name)
+	module.__dict__.update(attributes)
+	sys.modules[name] = module
+	parent, _, child = name.rpartition(".")
+	if parent:
+		setattr(sys.modules[parent], child, module)
+	return module
+
+
+def install(width=1920):
+	_Desktop.width, _Desktop.height = width, 1080 if width > 1300 else 720
+	iPlayableService = SimpleNamespace(evStart=0, evUpdatedInfo=1, evEnd=2)
+	_addModule("enigma", eTimer=eTimer, eServiceReference=eServiceReference, eEPGCache=FakeEPGCache, iPlayableService=iPlayableService, getDesktop=getDesktop)
+	for name in ("twisted", "twisted.internet", "Components", "Components.Renderer", "Components.Sources", "Screens", "Tools", "Plugins"):
+		_addModule(name)
+	_addModule("twisted.internet.reactor", callInThread=lambda function, *args, **kwargs: function(*args, **kwargs), callFromThread=lambda function, *args, **kwargs: function(*args, **kwargs))
+	_addModule("Components.ActionMap", ActionMap=_Anything)
+	_addModule("Components.Pixmap", Pixmap=_Widget)
+	_addModule("Components.Renderer.Picon", getPiconName=getPiconName, searchPaths=[])
+	_addModule("Components.ServiceEventTracker", ServiceEventTracker=_Anything)
+	_addModule("Components.Sources.List", List=List)
+	_addModule("Components.Sources.StaticText", StaticText=StaticText)
+	_addModule("Plugins.Plugin", PluginDescriptor=_Anything)
+	_addModule("Screens.AudioSelection", AudioSelection=_Anything)
+	_addModule("Screens.MessageBox", MessageBox=_Anything)
+	_addModule("Screens.Screen", Screen=Screen)
+	_addModule("Screens.VirtualKeyBoard", VirtualKeyBoard=_Anything)
+	_addModule("Tools.Directories", resolveFilename=lambda scope, path="": PLUGINPATH, SCOPE_PLUGINS=0)
+	_addModule("Tools.LoadPixmap", LoadPixmap=LoadPixmap)
+	if SRCPATH not in sys.path:
+		sys.path.insert(0, SRCPATH)
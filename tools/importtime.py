@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+########################################################################################################
+# Measures what enigma2 pays at boot for SkyMultiview: importing 'plugin.py' and calling 'Plugins()',  #
+# compared to also loading 'multiview.py' (screens, skins, globals), which now happens on 'main()'.    #
+# Every run is a fresh interpreter against the stand-ins from 'e2stubs.py', so the enigma2 modules     #
+# themselves cost nothing here and only the plugin's own import work is measured.                      #
+# usage: python3 tools/importtime.py [-r REPEAT] [--nobytecode]                                        #
+########################################################################################################
+
+from argparse import ArgumentParser
+from os.path import abspath, dirname
+from statistics import median
+from subprocess import check_output
+import sys
+
+CHILD = """
+import sys
+sys.path.insert(0, {toolsPath!r})
+import e2stubs
+e2stubs.install()
+from time import perf_counter
+startTs = perf_counter()
+from SkyMultiview import plugin
+plugin.Plugins()
+bootTs = perf_counter()
+from SkyMultiview import multiview
+print((bootTs - startTs) * 1000, (perf_counter() - startTs) * 1000)
+"""
+
+
+def main():
+	parser = ArgumentParser(description="cold start import time of the SkyMultiview plugin")
+	parser.add_argument("-r", "--repeat", type=int, default=20, help="number of fresh interpreters (default: 20)")
+	parser.add_argument("--nobytecode", action="store_true", help="ignore __pycache__, as on the very first boot after an update")
+	args = parser.parse_args()
+	command = [sys.executable, *(["-B", "-X", "pycache_prefix=/nonexistent"] if args.nobytecode else []), "-c", CHILD.format(toolsPath=dirname(abspath(__file__)))]
+	bootTimes, fullTimes = [], []
+	for _ in range(args.repeat):
+		bootTime, fullTime = (float(value) for value in check_output(command, text=True).split())
+		bootTimes.append(bootTime)
+		fullTimes.append(fullTime)
+	bootMedian, fullMedian = median(bootTimes), median(fullTimes)
+	print(f"{'stage':<36}{'median':>10}{'max':>10}")
+	print(f"{'boot: plugin.py + Plugins()':<36}{bootMedian:>8.2f}ms{max(bootTimes):>8.2f}ms")
+	print(f"{'before: plugin.py + multiview.py':<36}{fullMedian:>8.2f}ms{max(fullTimes):>8.2f}ms")
+	print(f"saving at boot: {fullMedian - bootMedian:.2f} ms ({(fullMedian - bootMedian) / fullMedian * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+########################################################################################################
+# Headless runner for the SkyMultiview matching pipeline. Replays an EPG dump (a recording of           #
+# MVepgRecorder, e.g. from a production box) or a synthetic scenario through the very same discovery   #
+# and matching code, prints the resulting multiviews and reports per-stage timings and counters.       #
+# usage: python3 tools/mvrun.py epgrecord.jsonl [--json] [--legacy] [--workers N]                      #
+#        python3 tools/mvrun.py -s saturday|weekend|stress [--json]                                    #
+########################################################################################################
+
+from argparse import ArgumentParser
+from datetime import datetime
+from json import dumps
+from operator import itemgetter
+import sys
+from time import perf_counter
+
+import e2stubs
+import skyepg
+
+
+def runPipeline(multiview, dumpFile, scenario):
+	helpers = multiview.MVhelpers()
+	if dumpFile:
+		helpers._instance = multiview.MVepgReplay(dumpFile)  # pylint: disable=protected-access
+		nowTs = helpers._instance.recorded  # pylint: disable=protected-access
+	else:
+		e2stubs.FakeEPGCache.load(skyepg.createScenario(scenario))
+		helpers._instance = e2stubs.FakeEPGCache()  # pylint: disable=protected-access
+		nowTs = skyepg.getNowTs(scenario)
+	helpers.epgStats, timings = {}, {}
+	startTs = perf_counter()
+	overviews = helpers.findMultiviews(nowTs)
+	timings["discovery"] = (perf_counter() - startTs) * 1000
+	discoveryStats, helpers.epgStats = helpers.epgStats, {}
+	startTs, mvRecords = perf_counter(), []
+	for mvRecord in helpers.iterMatches(overviews, nowTs):  # as MVeventSelect streams them into the menulist
+		if not mvRecords:
+			timings["first"] = (perf_counter() - startTs) * 1000
+		mvRecords.append(mvRecord)
+	mvRecords.sort(key=itemgetter(0))
+	timings["matching"] = (perf_counter() - startTs) * 1000
+	return nowTs, mvRecords, timings, {"discovery": discoveryStats, "matching": helpers.epgStats}
+
+
+def printRecords(mvRecords):
+	for mvRecord in mvRecords:
+		startStr = datetime.fromtimestamp(mvRecord.mvStart).strftime("%a %d.%m. %H:%M")
+		print(f"{startStr}  {mvRecord.mvId:<12} {mvRecord.mvSname}  ({int(mvRecord.mvDurance / 60)} min)  {mvRecord.mvEventText}")
+		for index, channel in enumerate(mvRecord.channels):
+			print(f"    Sendung {index + 1}: {channel.epgCaption:<44} {channel.epgSname}")
+		for index, conference in enumerate(mvRecord.conferences):
+			print(f"    Konferenz {index + 1}: {conference.epgCaption:<42} {conference.epgSname}")
+		if not mvRecord.channels and not mvRecord.conferences:
+			print("    {keine Einzelsendung gefunden}")
+
+
+def recordToDict(record):  # nested plain dicts, stable for diffs between two runs
+	return {field: [recordToDict(item) for item in value] if field in ("channels", "conferences") else value for field, value in record._asdict().items()}
+
+
+def main():
+	parser = ArgumentParser(description="SkyMultiview matching pipeline without enigma2")
+	parser.add_argument("dump", nargs="?", help="EPG dump, i.e. a recording of MVepgRecorder ('epgrecord.jsonl')")
+	parser.add_argument("-s", "--scenario", default="weekend", choices=skyepg.SCENARIOS, help="synthetic EPG if no dump is given (default: weekend)")
+	parser.add_argument("--json", action="store_true", help="print the multiviews as JSON, e.g. to diff two runs")
+	parser.add_argument("--legacy", action="store_true", help="one EPG query per overview instead of the bulk query")
+	parser.add_argument("--workers", type=int, default=0, help="run the searches for the single broadcasts on N threads (default: 0)")
+	args = parser.parse_args()
+	e2stubs.install()
+	from SkyMultiview import multiview  # pylint: disable=import-outside-toplevel
+	multiview.MVglobals.BULKSEARCH = not args.legacy
+	multiview.MVglobals.EPGWORKERS = args.workers
+	nowTs, mvRecords, timings, stats = runPipeline(multiview, args.dump, args.scenario)
+	if args.json:
+		print(dumps([recordToDict(mvRecord) for mvRecord in mvRecords], ensure_ascii=False, indent=1))
+	else:
+		printRecords(mvRecords)
+	report = sys.stderr if args.json else sys.stdout  # keep stdout clean for diffs
+	print(f"\n{args.dump or args.scenario} at {datetime.fromtimestamp(nowTs).strftime('%d.%m.%Y %H:%M')}: {len(mvRecords)} multiviews", file=report)
+	print(f"{'stage':<12}{'time':>10}{'queries':>9}{'scanned':>9}{'matched':>9}{'deduped':>9}", file=report)
+	firstTiming = timings.pop("first", None)
+	for stage, timing in timings.items():
+		counters = stats[stage]
+		print(f"{stage:<12}{timing:>8.3f}ms" + "".join(f"{counters.get(counter, 0):>9}" for counter in ("queries", "scanned", "matched", "deduped")), file=report)
+	if firstTiming is not None:
+		print(f"first multiview matched after {firstTiming:.3f}ms", file=report)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,97 @@
+########################################################################################################
+# Synthetic Sky EPG for the SkyMultiview developer tools. Builds eEPGCache.search() result tuples in   #
+# the 'IBDTSENRW' layout (event id, begin, duration, title, short, extended, sname, sref, genre).      #
+########################################################################################################
+
+from datetime import datetime, timedelta
+from random import Random
+
+BUNDESLIGA = ["BayernMünchen", "BorussiaDortmund", "RBLeipzig", "VfBStuttgart", "Bayer04Leverkusen", "EintrachtFrankfurt", "SCFreiburg", "VfLWolfsburg", "1.FSVMainz05",
+			"WerderBremen", "BorussiaM'Gladbach", "TSGHoffenheim", "FCAugsburg", "1.FCUnionBerlin", "1.FCHeidenheim", "FCStPauli", "HamburgerSV", "1.FCKöln"]
+ZWEITELIGA = ["HerthaBSC", "FCSchalke04", "Hannover96", "Fortuna Düsseldorf", "1.FCKaiserslautern", "1.FCNürnberg", "KarlsruherSC", "SCPaderborn07", "Holstein Kiel",
+			"VfLBochum", "SVDarmstadt98", "Eintracht Braunschweig", "SVElversberg", "Arminia Bielefeld", "Dynamo Dresden", "PreußenMünster", "1.FCMagdeburg", "SpVgg Greuther Fürth"]
+TENNIS = ["Sinner", "Alcaraz", "Zverev", "Djokovic", "Fritz", "Medvedev", "Rune", "DeMinaur", "Ruud", "Draper", "Tsitsipas", "Shelton"]
+F1FEEDS = ["Onboard-Verstappen", "Onboard-Norris", "Onboard-Leclerc", "Onboard-Hamilton", "Datenkanal", "Boxengasse"]
+OTHERCHANNELS = ["Das Erste HD", "ZDF HD", "RTL HD", "SAT.1 HD", "ProSieben HD", "VOX HD", "kabel eins HD", "3sat HD", "arte HD", "phoenix HD", "Sky One", "Sky Atlantic",
+				"Sky Cinema Premieren", "Sky Cinema Action", "Sky Krimi", "Sky Documentaries", "Sky Nature", "Eurosport 1 HD", "sportdigital", "DAZN 1 Bar"]
+OTHERTITLES = ["Tagesschau", "heute journal", "Live nach Neun", "Sportschau", "Das aktuelle Sportstudio", "Tatort", "Die Simpsons", "Formel 1: Das Magazin", "Golf: Live PGA Tour",
+			"Premier League Live", "Serie A Live", "Tennis: WTA Finals Highlights", "Dokumentation", "Spielfilm", "Nachrichten", "Wetter", "Live: Darts WM", "LaLiga Live"]
+WEEKDAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+SCENARIOS = ("saturday", "weekend", "stress")
+SATURDAY = datetime(2025, 10, 18)  # a Saturday, the scenarios are anchored here to make runs comparable
+
+
+class SkyEPG:
+	def __init__(self, seed=2025):
+		self.random = Random(seed)
+		self.events = []
+		self.eventId = 1000
+
+	def addEvent(self, begin, duration, title, short, sname, sref):
+		self.eventId += 1
+		self.events.append((self.eventId, int(begin), int(duration), title, short, "", sname, sref, ""))
+
+	def sref(self, sid):
+		return f"1:0:19:{sid:X}:2F:85:C00000:0:0:0:"
+
+	def addMultiview(self, mvId, begin, duration, label, feeds, sport, sname, conferences=1, channelPrefix="Sky Sport Bundesliga", firstChannel=2):
+		begin = begin.timestamp()
+		self.addEvent(begin - 900, duration + 900, f"{mvId}:Multiview,{label}", f"{sport}:{label}", sname, self.sref(0x1100 + int(begin) % 97))
+		for index, feed in enumerate(feeds):
+			channelNo = firstChannel + index
+			self.addEvent(begin + self.random.choice((0, 0, 0, 300)), duration, f"{mvId}:{feed},{label}", f"{sport}:{feed},{label}", f"{channelPrefix} {channelNo}", self.sref(0x1200 + channelNo))
+		for index in range(conferences):
+			sname = "Sky Sport Top Event" if index else "Sky Sport Bundesliga 1"
+			self.addEvent(begin, duration, f"{mvId}:Konferenz{index + 1 if index else ''},{label}", f"{sport}:AlleSpiele,alleTore,{label}", sname, self.sref(0x1300 + index))
+		self.addEvent(begin + 60, duration, f"{mvId}:{feeds[0] if feeds else ''},{label}", f"{sport}:{label}", "ZDF HD", self.sref(0x2B66))  # same title on a non-sky channel
+
+	def pairings(self, teams, games):
+		teams = teams[:]
+		self.random.shuffle(teams)
+		return [f"{teams[index * 2]}-{teams[index * 2 + 1]}" for index in range(games)]
+
+	def addBundesligaDay(self, day, matchday, full=True):
+		if full:  # saturday 15:30, 5 games in parallel
+			self.addMultiview("LiveBL", day.replace(hour=15, minute=30), 6900, f"{matchday}.Spieltag,Samstag", self.pairings(BUNDESLIGA, 5), "Fußball:Bundesliga", "Sky Sport Bundesliga 1")
+		self.addMultiview("Live2.BL", day.replace(hour=13), 6900, f"{matchday}.Spieltag,{WEEKDAYS[day.weekday()]}", self.pairings(ZWEITELIGA, 4 if full else 3), "Fußball:2.Bundesliga", "Sky Sport Bundesliga 1")
+
+	def addTennisDay(self, day, label):
+		self.addMultiview("LiveTennis", day.replace(hour=11), 36000, label, self.pairings(TENNIS, 4), "Tennis:ATPMasters1000", "Sky Sport 1", conferences=0, channelPrefix="Sky Sport", firstChannel=2)
+
+	def addFormula1(self, day, label):
+		self.addMultiview("LiveF1", day.replace(hour=14), 9000, label, F1FEEDS, "Formel1:GroßerPreis", "Sky Sport 1", conferences=0, channelPrefix="Sky Sport", firstChannel=3)
+
+	def addNoise(self, start, days, count):
+		for _ in range(count):
+			sname = self.random.choice(OTHERCHANNELS)
+			begin = start.timestamp() + self.random.randrange(0, days * 86400, 300)
+			self.addEvent(begin, self.random.choice((900, 1800, 3600, 5400)), self.random.choice(OTHERTITLES), "", sname, self.sref(0x3000 + OTHERCHANNELS.index(sname)))
+
+	def finish(self):  # the real cache returns its results grouped by service, ordered by begin time
+		self.events.sort(key=lambda event: (event[7], event[1]))
+		return self.events
+
+
+def createScenario(scenario, seed=2025):
+	epg = SkyEPG(seed)
+	if scenario == "saturday":  # a single Bundesliga Saturday
+		epg.addBundesligaDay(SATURDAY, 7)
+		epg.addNoise(SATURDAY, 1, 600)
+	elif scenario in ("weekend", "stress"):  # friday to sunday with 2. Bundesliga, tennis and F1
+		weekends = 4 if scenario == "stress" else 1
+		for weekend in range(weekends):
+			saturday = SATURDAY + timedelta(days=7 * weekend)
+			epg.addBundesligaDay(saturday - timedelta(days=1), 7 + weekend, full=False)
+			epg.addBundesligaDay(saturday, 7 + weekend)
+			epg.addBundesligaDay(saturday + timedelta(days=1), 7 + weekend, full=False)
+			epg.addTennisDay(saturday, "Halbfinale")
+			epg.addTennisDay(saturday + timedelta(days=1), "Finale")
+			epg.addFormula1(saturday + timedelta(days=1), "Mexiko,Rennen")
+		epg.addNoise(SATURDAY - timedelta(days=1), 7 * weekends, 12000 if scenario == "stress" else 2500)
+	else:
+		raise ValueError(f"unknown scenario '{scenario}', choose from {', '.join(SCENARIOS)}")
+	return epg.finish()
+
+
+def getNowTs(scenario):  # an instant during the busiest time slot of the scenario
+	return SATURDAY.replace(hour=16).timestamp()